@@ -3,14 +3,11 @@ import argparse
 import logging
 import sys
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
-from matplotlib.ticker import MaxNLocator
-from src.legacy.entities import Projectile, Interceptor, ManeuveringDrone
-from src.legacy.guidance import augmented_proportional_navigation, limit_g_load
 from src.legacy.config import SimulationConfig, RadarConfig
-from src.legacy.sensors import Radar
-from src.legacy.estimation import KalmanFilter
+from src.legacy.engagement import Engagement, generate_scenario
+from src.core.checkpoint import save_checkpoint, load_checkpoint
+from src.core.rng import RngStreams
+from src.analysis.cache import ResultCache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,79 +21,107 @@ def parse_args():
     parser.add_argument("--seed", type=int, help="Scenario Seed")
     parser.add_argument("--mode", choices=['random', 'dogfight', 'ballistic'], default='random')
     parser.add_argument("--intercept-g", type=float, default=55.0)
+    parser.add_argument("--n-gain", type=float, default=5.0, help="Proportional navigation gain")
+    parser.add_argument("--tau", type=float, default=0.05, help="Interceptor autopilot lag (s)")
     parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--full-run", action="store_true", help="Disable early termination of decided misses")
+    parser.add_argument("--follow-camera", action="store_true", help="Track the engagement (disables blitting)")
+    parser.add_argument("--checkpoint", metavar="PATH", help="Save a full simulation checkpoint at --checkpoint-time")
+    parser.add_argument("--checkpoint-time", type=float, default=15.0)
+    parser.add_argument("--resume", metavar="PATH", help="Continue from a saved checkpoint")
+    parser.add_argument("--pk-study", action="store_true", help="Estimate Pk/CEP by sequential Monte Carlo")
+    parser.add_argument("--pk-width", type=float, default=0.05, help="Target Pk confidence interval width")
+    parser.add_argument("--sampler", choices=['sobol', 'lhs', 'random'], default='sobol')
+    parser.add_argument("--max-runs", type=int, default=4096)
+    parser.add_argument("--stratify", metavar="PARAM", help="Scenario parameter to stratify on (e.g. dist)")
+    parser.add_argument("--tune", action="store_true", help="Tune guidance gains against a fixed scenario set")
+    parser.add_argument("--objective", choices=['pk', 'miss'], default='pk', help="Tuning objective")
+    parser.add_argument("--scenarios", type=int, default=32, help="Scenario set size for --tune")
+    parser.add_argument("--population", type=int, default=16)
+    parser.add_argument("--generations", type=int, default=6)
+    parser.add_argument("--workers", type=int, help="Parallel processes for --tune (0 = serial, default: all cores)")
+    parser.add_argument("--cache", metavar="DIR", help="Reuse results from an on-disk result cache")
+    parser.add_argument("--render-video", metavar="PATH", help="Render the animation to a video/GIF file instead of a window")
     return parser.parse_args()
 
-def generate_scenario(mode, seed):
-    rng = np.random.default_rng(seed)
-    if mode == 'random':
-        mode = rng.choice(['dogfight', 'ballistic'])
-    logger.info(f"GENERATING SCENARIO: {mode.upper()} | SEED: {seed}")
-    if mode == 'ballistic':
-        dist = rng.uniform(20000, 35000)
-        angle = np.deg2rad(rng.uniform(40, 60))
-        speed = np.sqrt(dist * 9.81 / np.sin(2*angle)) * rng.uniform(1.1, 1.3)
-        azimuth = rng.uniform(0, 2*np.pi)
-        spawn_pos = [dist * np.cos(azimuth), dist * np.sin(azimuth), 0]
-        v_rad = -speed * np.cos(angle)
-        v_z = speed * np.sin(angle)
-        vel = [v_rad * np.cos(azimuth), v_rad * np.sin(azimuth), v_z]
-        target = Projectile(spawn_pos, vel, mass=300.0, cd=0.2, area=0.1)
-    else: 
-        dist = rng.uniform(12000, 25000)
-        alt = rng.uniform(2000, 8000)
-        azimuth = rng.uniform(0, 2*np.pi)
-        spawn_pos = [dist * np.cos(azimuth), dist * np.sin(azimuth), alt]
-        speed = rng.uniform(270, 680)
-        offset_x = rng.uniform(-3000, 3000)
-        offset_y = rng.uniform(-3000, 3000)
-        target_point = np.array([offset_x, offset_y, 0])
-        curr_pos = np.array(spawn_pos)
-        direction = target_point - curr_pos
-        direction = direction / np.linalg.norm(direction)
-        vel = direction * speed
-        target = ManeuveringDrone(spawn_pos, vel, seed=seed)
-    return target
+def run_pk_study(args):
+    from src.analysis.montecarlo import PkStudy
+    mode = 'ballistic' if args.mode == 'random' else args.mode
+    study = PkStudy(mode, sampler=args.sampler, target_width=args.pk_width, max_runs=args.max_runs,
+                    seed=args.seed or 0, intercept_g=args.intercept_g, n_gain=args.n_gain,
+                    tau=args.tau, stratify=args.stratify,
+                    cache=ResultCache(args.cache) if args.cache else None)
+    est = study.run()
+    logger.info(f"PK RESULT | {mode.upper()} | N={est.runs} | Pk={est.pk:.3f} [{est.pk_low:.3f}, {est.pk_high:.3f}] "
+                f"| CEP={est.cep:.2f}m | CONVERGED={est.converged}")
+
+def run_tuning(args):
+    from src.analysis.tuning import GainTuner, scenario_set
+    mode = 'ballistic' if args.mode == 'random' else args.mode
+    tuner = GainTuner(scenario_set(mode, args.scenarios, args.seed or 0), objective=args.objective,
+                      population=args.population, generations=args.generations, seed=args.seed or 0,
+                      workers=args.workers, cache=ResultCache(args.cache) if args.cache else None)
+    best = tuner.run()
+    logger.info(f"TUNE RESULT | {mode.upper()} | Pk={best.pk:.3f} | Miss={best.mean_miss:.2f}m "
+                f"| Peak={best.peak_g:.1f}g | {best.gains}")
+    for score in tuner.pareto_front():
+        logger.info(f"PARETO | Peak={score.peak_g:5.1f}g | Pk={score.pk:.3f} | Miss={score.mean_miss:.2f}m | {score.gains}")
 
 def run_simulation(args):
-    if args.seed is None:
+    if args.seed is None and not args.resume:
         args.seed = np.random.randint(0, 100000)
-    target = generate_scenario(args.mode, args.seed)
-    interceptor = Interceptor(pos=[0, 0, 0], vel=[0.01, 0.01, 100])
-    sim_cfg = SimulationConfig()
-    radar_cfg = RadarConfig()
-    radar = Radar(radar_cfg)
-    kf = KalmanFilter(sim_cfg.DT, radar_cfg.POS_NOISE_STD, radar_cfg.VEL_NOISE_STD)
-    kf.x = radar.measure(target.state)
-    time = 0.0
-    sim_running = True
-    intercepted = False
-    est_history = []
-    while sim_running and time < 90.0:
-        target.update(sim_cfg.DT)
-        meas = radar.measure(target.state)
-        kf.predict()
-        kf.update(meas)
-        est_state = kf.get_state()
-        est_history.append(est_state[:3])
-        if interceptor.active:
-            def guidance(r, v):
-                cmd = augmented_proportional_navigation(r, v, n_gain=5.0) 
-                return limit_g_load(cmd, max_g=args.intercept_g)
-            interceptor.update_guidance(sim_cfg.DT, est_state[:3], est_state[3:], guidance)
-            dist = np.linalg.norm(interceptor.state[:3] - target.state[:3])
-            if dist < 15.0:
-                logger.info(f"SPLASH | T={time:.2f}s | Miss={dist:.2f}m")
-                intercepted = True
-                sim_running = False
-        if target.state[2] < 0:
-            logger.info("TARGET GROUND IMPACT")
-            sim_running = False
-        time += sim_cfg.DT
-    if not args.headless:
-        visualize_results(target, interceptor, est_history, intercepted, args.seed)
+    if args.render_video:
+        from src.visualization.renderer import resolve_video_path
+        args.render_video = resolve_video_path(args.render_video)
+    # Checkpointed runs have state outside the cache key, so they always simulate
+    cache = ResultCache(args.cache) if args.cache and not (args.resume or args.checkpoint) else None
+    if cache is not None:
+        key = cache.key(kind='run', mode=args.mode, seed=args.seed, sim_cfg=SimulationConfig(),
+                        radar_cfg=RadarConfig(), intercept_g=args.intercept_g, n_gain=args.n_gain,
+                        tau=args.tau, early_stop=not args.full_run)
+        summary = cache.get(key)
+        # Plotting needs the trajectories; without them the run is simulated again
+        plots = not args.headless or args.render_video
+        traj = cache.get_trajectories(key) if summary is not None and plots else None
+        if summary is not None and (not plots or traj is not None):
+            logger.info(f"CACHE HIT | SEED: {args.seed} | INTERCEPTED={summary['hit']} | Miss={summary['miss']:.2f}m")
+            if plots:
+                visualize_results(traj['target'], traj['interceptor'], summary['hit'], args.seed,
+                                  follow=args.follow_camera, video_path=args.render_video)
+            return
+    if args.resume:
+        sim = load_checkpoint(args.resume)
+        logger.info(f"RESUMING CHECKPOINT | {args.resume} | T={sim.time:.2f}s")
+    else:
+        target = generate_scenario(args.mode, args.seed)
+        sim = Engagement(target, SimulationConfig(), RadarConfig(), intercept_g=args.intercept_g,
+                         n_gain=args.n_gain, streams=RngStreams(args.seed), seed=args.seed,
+                         early_stop=not args.full_run, tau=args.tau)
+    if args.checkpoint:
+        sim.run(until=args.checkpoint_time)
+        save_checkpoint(sim, args.checkpoint)
+        logger.info(f"CHECKPOINT SAVED | {args.checkpoint} | T={sim.time:.2f}s")
+    sim.run()
+    t_hist = np.array(sim.target.history)
+    i_hist = np.array(sim.interceptor.history)
+    if cache is not None:
+        summary = {'hit': sim.intercepted, 'miss': float(sim.miss_distance), 'time': sim.time,
+                   'reason': sim.termination_reason, 'peak_g': sim.peak_g}
+        cache.put(key, summary, {'target': t_hist, 'interceptor': i_hist, 'estimate': np.array(sim.est_history)})
+    if args.render_video:
+        visualize_results(t_hist, i_hist, sim.intercepted, sim.seed,
+                          follow=args.follow_camera, video_path=args.render_video)
+    elif not args.headless:
+        visualize_results(t_hist, i_hist, sim.intercepted, sim.seed, follow=args.follow_camera)
 
-def visualize_results(target, interceptor, est_hist, success, seed):
+def visualize_results(t_hist, i_hist, success, seed, follow=False, video_path=None):
+    # Plotting (and scipy via the Pk study) is imported on demand so headless runs never load it
+    import matplotlib
+    if video_path:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib.ticker import MaxNLocator
+    from src.visualization.renderer import TrajectoryRenderer
     plt.style.use('dark_background')
     fig = plt.figure(figsize=(16, 10))
     ax = fig.add_subplot(111, projection='3d')
@@ -107,46 +132,33 @@ def visualize_results(target, interceptor, est_hist, success, seed):
     ax.yaxis.set_major_locator(MaxNLocator(nbins=6))
     ax.zaxis.set_major_locator(MaxNLocator(nbins=5))
     ax.grid(color='#707070', linestyle=':', linewidth=0.8, alpha=0.12)
-    t_hist = np.array(target.history)
-    i_hist = np.array(interceptor.history)
     ax.set_title(f'SIMULATION ID: {seed} | STATUS: {"NEUTRALIZED" if success else "FAILURE"}', color='white', pad=20)
     ax.set_xlabel('X [m]', color='gray')
     ax.set_ylabel('Y [m]', color='gray')
     ax.set_zlabel('ALT [m]', color='gray')
-    all_points = np.vstack((t_hist, i_hist))
-    max_ex = np.max(np.abs(all_points[:,:2])) 
-    ax.set_xlim([-max_ex, max_ex])
-    ax.set_ylim([-max_ex, max_ex])
-    ax.set_zlim([0, np.max(all_points[:,2])*1.1])
-    line_tgt, = ax.plot([], [], [], color='#FF2222', linewidth=2.0, alpha=0.9, label='THREAT')
-    line_int, = ax.plot([], [], [], color='#00FFDD', linewidth=2.5, alpha=1.0, label='INTERCEPTOR')
+    renderer = TrajectoryRenderer(ax, follow=follow)
+    renderer.add_group([t_hist], color='#FF2222', linewidth=2.0, alpha=0.9, label='THREAT')
+    renderer.add_group([i_hist], color='#00FFDD', linewidth=2.5, label='INTERCEPTOR')
+    renderer.fit_limits()
     scat_hit = ax.scatter([], [], [], s=0, c='white', marker='o', edgecolors='#ffcc00', linewidth=1.5, zorder=100)
     ax.legend(frameon=False, labelcolor='linecolor')
-    frames = len(t_hist)
-    skip = max(1, frames // 400) 
-    def update(frame):
-        idx = frame * skip
-        if idx >= frames: idx = frames - 1
-        line_tgt.set_data(t_hist[:idx, 0], t_hist[:idx, 1])
-        line_tgt.set_3d_properties(t_hist[:idx, 2])
-        if idx < len(i_hist):
-            line_int.set_data(i_hist[:idx, 0], i_hist[:idx, 1])
-            line_int.set_3d_properties(i_hist[:idx, 2])
-            head_t = t_hist[idx]
-            head_i = i_hist[idx]
-            mid = (head_t + head_i) / 2
-            sep = np.linalg.norm(head_t - head_i)
-            zoom = max(sep, 3000) 
-            ax.set_xlim([mid[0]-zoom, mid[0]+zoom])
-            ax.set_ylim([mid[1]-zoom, mid[1]+zoom])
-            ax.set_zlim([max(0, mid[2]-zoom/2), mid[2]+zoom])
+    def on_frame(idx):
         if success and idx >= len(i_hist)-1:
             scat_hit._offsets3d = ([i_hist[-1,0]], [i_hist[-1,1]], [i_hist[-1,2]])
             scat_hit.set_sizes([150])
-        return line_tgt, line_int, scat_hit
-    ani = FuncAnimation(fig, update, frames=frames//skip + 30, interval=20, blit=False)
+        return [scat_hit]
+    if video_path:
+        logger.info(f"RENDERING VIDEO | {video_path}")
+        renderer.render_video(fig, video_path, on_frame=on_frame)
+        return
+    ani = renderer.animate(fig, on_frame=on_frame)
     plt.show()
 
 if __name__ == "__main__":
     args = parse_args()
-    run_simulation(args)
\ No newline at end of file
+    if args.pk_study:
+        run_pk_study(args)
+    elif args.tune:
+        run_tuning(args)
+    else:
+        run_simulation(args)
\ No newline at end of file
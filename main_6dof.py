@@ -1,13 +1,23 @@
 ### main_6dof.py
+import argparse
 import numpy as np
 import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
 from src.core.battle_manager import BattleManager
+from src.visualization.renderer import TrajectoryRenderer, resolve_video_path
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Kinetic Defense Simulation (6-DOF)")
+    parser.add_argument("--early-stop", action="store_true", help="Retire interceptors whose engagement is a decided miss")
+    parser.add_argument("--render-video", metavar="PATH", help="Render the animation to a video/GIF file instead of a window")
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+    if args.render_video:
+        args.render_video = resolve_video_path(args.render_video)
     print("Initializing Multi-Target Kinetic Defense Simulation (6-DOF)...")
     
-    manager = BattleManager()
+    manager = BattleManager(early_stop=args.early_stop)
     
     # --- SCENARIO SETUP ---
     
@@ -56,24 +66,31 @@ def main():
             break
 
     # --- VISUALIZATION ---
+    if args.render_video:
+        plt.switch_backend('Agg')
     fig = plt.figure()
     ax = fig.add_subplot(111, projection='3d')
     
-    # Plot Threats
-    for t in manager.threats:
-        hist = np.array(t.history)
-        ax.plot(hist[:,0], hist[:,1], hist[:,2], label=f'Threat {t.id} {"(Kill)" if not t.active else ""}')
-        ax.scatter(hist[-1,0], hist[-1,1], hist[-1,2], marker='x')
+    # One collection per side keeps the artist count flat for large raids
+    renderer = TrajectoryRenderer(ax)
+    renderer.add_group([t.history for t in manager.threats], color='tab:red', label='Threats')
+    renderer.add_group([m.history for m in manager.interceptors], color='tab:cyan', linestyle='--', label='Interceptors')
+    renderer.fit_limits()
 
-    # Plot Interceptors
-    for m in manager.interceptors:
-        hist = np.array(m.history)
-        ax.plot(hist[:,0], hist[:,1], hist[:,2], linestyle='--', label=f'Int {m.id}')
+    # Kill markers
+    for t in manager.threats:
+        if not t.active:
+            pos = t.history[-1]
+            ax.scatter(pos[0], pos[1], pos[2], marker='x', color='white')
         
     ax.set_xlabel('X')
     ax.set_ylabel('Y')
     ax.set_zlabel('Z')
     ax.legend()
+    if args.render_video:
+        renderer.render_video(fig, args.render_video)
+        return
+    ani = renderer.animate(fig)
     plt.show()
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+### KineticDefenseSim/main_worker.py
+import argparse
+import logging
+import sys
+from src.service.worker import benchmark_startup, serve
+
+# stdout carries the job protocol, so engine logging goes to stderr
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s | %(levelname)8s | %(message)s',
+    handlers=[logging.StreamHandler(sys.stderr)]
+)
+logger = logging.getLogger("KineticDefenseSim")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Kinetic Defense Simulation worker (JSON-lines jobs)")
+    parser.add_argument("--workers", type=int, default=0, help="Warm pool size (0 = run jobs in this process)")
+    parser.add_argument("--cache", metavar="DIR", help="Reuse results from an on-disk result cache")
+    parser.add_argument("--listen", metavar="HOST:PORT", help="Serve a local TCP socket instead of stdin/stdout")
+    parser.add_argument("--benchmark", type=int, metavar="N", help="Compare N cold main.py runs against the warm worker")
+    parser.add_argument("--mode", choices=['random', 'dogfight', 'ballistic'], default='ballistic',
+                        help="Scenario mode for --benchmark")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.benchmark:
+        report = benchmark_startup(list(range(args.benchmark)), args.mode)
+        for name, value in report.items():
+            print(f"{name:>16}: {value:.3f}" if isinstance(value, float) else f"{name:>16}: {value}")
+    elif args.listen:
+        host, _, port = args.listen.rpartition(':')
+        serve(args.workers, args.cache, host or '127.0.0.1', int(port))
+    else:
+        serve(args.workers, args.cache)
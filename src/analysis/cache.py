@@ -0,0 +1,147 @@
+### KineticDefenseSim/src/analysis/cache.py
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+import numpy as np
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+@lru_cache(maxsize=1)
+def source_fingerprint() -> str:
+    """Hash of every simulation source file, so edits to the engine invalidate old results."""
+    h = hashlib.sha256()
+    files = sorted(PROJECT_ROOT.glob('src/**/*.py')) + [PROJECT_ROOT / 'main.py']
+    for path in files:
+        if path.is_file():
+            h.update(path.relative_to(PROJECT_ROOT).as_posix().encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+def _canonical(obj):
+    if dataclasses.is_dataclass(obj):
+        return {type(obj).__name__: dataclasses.asdict(obj)}
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Cannot hash {type(obj).__name__} into a cache key")
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache of simulation results.
+
+    Each entry is `<key>.json` (run summary) plus an optional `<key>.npz`
+    (compressed trajectories), sharded by the first two hex digits of the key.
+    Files are written to a temporary name and atomically renamed, with the
+    summary written last, so concurrent readers in other processes only ever
+    see complete entries. Reads refresh the mtime, which is the LRU clock used
+    to evict the oldest entries once the cache exceeds `max_bytes`.
+
+    The cache size is scanned once, then kept as a running estimate from this
+    process's writes; the tree is only walked again when the estimate crosses
+    `max_bytes`, or every `rescan_every` puts to pick up other processes' writes.
+    """
+
+    def __init__(self, root: str = '.sim_cache', max_bytes: int = 512 * 1024**2, rescan_every: int = 1024):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.rescan_every = rescan_every
+        self._size: Optional[int] = None
+        self._puts = 0
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def key(self, **inputs) -> str:
+        payload = json.dumps({'inputs': inputs, 'source': source_fingerprint()},
+                             sort_keys=True, default=_canonical)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.root / key[:2] / f"{key}{suffix}"
+
+    def _touch(self, path: Path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def get(self, key: str) -> Optional[dict]:
+        path = self._path(key, '.json')
+        try:
+            with open(path, 'r') as f:
+                summary = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._touch(path)
+        return summary
+
+    def get_trajectories(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        path = self._path(key, '.npz')
+        try:
+            with np.load(path) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (OSError, ValueError):
+            return None
+        self._touch(path)
+        return arrays
+
+    def _atomic_write(self, path: Path, write):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def put(self, key: str, summary: dict, trajectories: Optional[Dict[str, np.ndarray]] = None):
+        written = 0
+        if trajectories is not None:
+            path = self._path(key, '.npz')
+            self._atomic_write(path, lambda f: np.savez_compressed(f, **trajectories))
+            written += path.stat().st_size
+        data = json.dumps(summary, default=_canonical).encode()
+        self._atomic_write(self._path(key, '.json'), lambda f: f.write(data))
+        written += len(data)
+        self._puts += 1
+        if self._size is not None:
+            # Overwrites are counted twice, which only makes the next scan come sooner
+            self._size += written
+        if self._size is None or self._size > self.max_bytes or self._puts % self.rescan_every == 0:
+            self.evict()
+
+    def evict(self):
+        """Walks the tree, drops least recently used entries once above `max_bytes` and resyncs the size estimate."""
+        entries = {}
+        for path in self.root.glob('*/*'):
+            if path.name.startswith('.tmp-'):
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            size, mtime = entries.get(path.stem, (0, 0.0))
+            entries[path.stem] = (size + st.st_size, max(mtime, st.st_mtime))
+        total = sum(size for size, _ in entries.values())
+        # Evict down to a low-water mark so a full cache is not rescanned on every put
+        target = self.max_bytes if total <= self.max_bytes else 0.9 * self.max_bytes
+        for key, (size, _) in sorted(entries.items(), key=lambda kv: kv[1][1]):
+            if total <= target:
+                break
+            for suffix in ('.json', '.npz'):
+                try:
+                    self._path(key, suffix).unlink()
+                except OSError:
+                    # Already evicted by another process, or held open on Windows
+                    pass
+            total -= size
+        self._size = total
@@ -0,0 +1,272 @@
+### KineticDefenseSim/src/analysis/montecarlo.py
+import dataclasses
+import logging
+import numpy as np
+from dataclasses import dataclass
+from scipy.stats import norm, qmc
+from typing import Callable, Dict, List, Optional, Sequence
+from src.legacy.config import SimulationConfig, RadarConfig
+from src.legacy.entities import DRONE_G_LOAD_RANGE
+from src.legacy.engagement import Engagement, SCENARIO_BOUNDS, build_scenario
+from src.analysis.cache import ResultCache
+from src.core.battle_manager import BattleManager
+from src.core.rng import RngStreams
+
+logger = logging.getLogger("KineticDefenseSim")
+
+@dataclass(frozen=True)
+class CaseSpec:
+    mode: str
+    params: Dict[str, float]
+    seed: int
+    master_seed: int = 0
+    intercept_g: float = 55.0
+    n_gain: float = 5.0
+    early_stop: bool = True
+    tau: float = 0.05
+
+@dataclass(frozen=True)
+class PkEstimate:
+    runs: int
+    pk: float
+    pk_low: float
+    pk_high: float
+    cep: float
+    cep_low: float
+    cep_high: float
+    n_eff: float
+    converged: bool
+
+def parameter_space(mode: str) -> Dict[str, tuple]:
+    """Sampled dimensions for a mode: scenario geometry plus drone maneuver g-load."""
+    space = dict(SCENARIO_BOUNDS[mode])
+    if mode == 'dogfight':
+        space['g_load'] = DRONE_G_LOAD_RANGE
+    return space
+
+def evaluate_case(case: CaseSpec, sim_cfg: SimulationConfig = SimulationConfig(),
+                  radar_cfg: RadarConfig = RadarConfig(), cache: Optional[ResultCache] = None) -> dict:
+    if cache is not None:
+        key = cache.key(kind='case', case=case, sim_cfg=sim_cfg, radar_cfg=radar_cfg)
+        summary = cache.get(key)
+        if summary is not None:
+            return summary
+    streams = RngStreams(case.master_seed)
+    target = build_scenario(case.mode, case.params, streams.generator('scenario', case.seed, 'target', 0, 'maneuver'))
+    sim = Engagement(target, sim_cfg, radar_cfg, intercept_g=case.intercept_g,
+                     n_gain=case.n_gain, streams=streams, seed=case.seed,
+                     early_stop=case.early_stop, tau=case.tau).run()
+    summary = {'hit': sim.intercepted, 'miss': float(sim.miss_distance), 'time': sim.time,
+               'reason': sim.termination_reason, 'peak_g': sim.peak_g}
+    if cache is not None:
+        cache.put(key, summary)
+    return summary
+
+class UnitSampler:
+    """Batches of points in [0, 1)^d from a Sobol', Latin-hypercube or plain pseudo-random design."""
+
+    def __init__(self, dim: int, kind: str = 'sobol', seed: Optional[int] = None):
+        self.kind = kind
+        self.rng = np.random.default_rng(seed)
+        if kind == 'sobol':
+            self.engine = qmc.Sobol(dim, scramble=True, seed=self.rng)
+        elif kind == 'lhs':
+            self.engine = qmc.LatinHypercube(dim, seed=self.rng)
+        elif kind == 'random':
+            self.engine = None
+            self.dim = dim
+        else:
+            raise ValueError(f"Unknown sampler: {kind}")
+
+    def draw(self, n: int) -> np.ndarray:
+        if self.engine is None:
+            return self.rng.random((n, self.dim))
+        return self.engine.random(n)
+
+def wilson_interval(p: float, n: float, z: float):
+    if n <= 0:
+        return 0.0, 1.0
+    denom = 1 + z**2 / n
+    centre = (p + z**2 / (2*n)) / denom
+    half = z * np.sqrt(p * (1 - p) / n + z**2 / (4 * n**2)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+def weighted_quantile(values: np.ndarray, weights: np.ndarray, q: float) -> float:
+    order = np.argsort(values)
+    cw = np.cumsum(weights[order])
+    idx = np.searchsorted(cw, np.clip(q, 0.0, 1.0) * cw[-1])
+    return float(values[order][min(idx, len(values) - 1)])
+
+class PkStudy:
+    """
+    Sequential Monte Carlo estimate of probability of kill and CEP.
+
+    Scenario parameters come from a quasi-random design and runs are added in
+    batches until the Pk confidence interval is narrower than `target_width`.
+    With `stratify` set to a parameter name, that dimension is split into
+    `n_strata` equal-probability strata and each batch is allocated by Neyman
+    allocation (proportional to the stratum's Bernoulli std). Samples therefore
+    concentrate where Pk is uncertain, i.e. near the envelope edge. Each sample
+    carries the stratum's likelihood-ratio weight, so Pk and CEP stay unbiased.
+    """
+
+    def __init__(self, mode: str = 'ballistic', sampler: str = 'sobol', target_width: float = 0.05,
+                 confidence: float = 0.95, batch: int = 32, min_runs: int = 64, max_runs: int = 4096,
+                 seed: int = 0, intercept_g: float = 55.0, n_gain: float = 5.0, tau: float = 0.05,
+                 stratify: Optional[str] = None, n_strata: int = 8,
+                 evaluate: Optional[Callable[[Sequence[CaseSpec]], List[dict]]] = None,
+                 cache: Optional[ResultCache] = None):
+        if mode not in SCENARIO_BOUNDS:
+            raise ValueError(f"PkStudy needs a concrete mode, got {mode!r}")
+        self.mode = mode
+        self.space = parameter_space(mode)
+        self.names = list(self.space)
+        self.target_width = target_width
+        self.z = norm.ppf(0.5 + confidence / 2)
+        self.batch = batch
+        self.min_runs = min_runs
+        self.max_runs = max_runs
+        self.seed = seed
+        self.intercept_g = intercept_g
+        self.n_gain = n_gain
+        self.tau = tau
+        self.sampler = UnitSampler(len(self.names), sampler, seed)
+        self.strat_dim = self.names.index(stratify) if stratify else None
+        self.n_strata = n_strata if stratify else 1
+        self.evaluate = evaluate or (lambda cases: [evaluate_case(c, cache=cache) for c in cases])
+        self.cases: List[CaseSpec] = []
+        self.hits: List[bool] = []
+        self.misses: List[float] = []
+        self.strata: List[int] = []
+
+    def _allocate(self, n: int) -> np.ndarray:
+        """Stratum index for each of the next n samples."""
+        if self.n_strata == 1:
+            return np.zeros(n, dtype=int)
+        counts = np.bincount(self.strata, minlength=self.n_strata)
+        if counts.min() < 2:
+            return np.arange(n) % self.n_strata
+        hits = np.bincount(self.strata, weights=self.hits, minlength=self.n_strata)
+        # +1/+2 smoothing keeps all-hit / all-miss strata from being starved entirely
+        p = (hits + 1) / (counts + 2)
+        share = np.sqrt(p * (1 - p))
+        alloc = np.floor(n * share / share.sum()).astype(int)
+        alloc[np.argsort(-share)[:n - alloc.sum()]] += 1
+        return np.repeat(np.arange(self.n_strata), alloc)
+
+    def _next_cases(self, n: int) -> List[CaseSpec]:
+        u = self.sampler.draw(n)
+        strata = self._allocate(n)
+        if self.strat_dim is not None:
+            u[:, self.strat_dim] = (strata + u[:, self.strat_dim]) / self.n_strata
+        self.strata.extend(strata.tolist())
+        cases = []
+        for row in u:
+            params = {name: lo + r * (hi - lo) for name, r, (lo, hi) in zip(self.names, row, self.space.values())}
+            cases.append(CaseSpec(self.mode, params, len(self.cases) + len(cases), self.seed,
+                                  self.intercept_g, self.n_gain, tau=self.tau))
+        return cases
+
+    def _weights(self) -> np.ndarray:
+        strata = np.asarray(self.strata)
+        counts = np.bincount(strata, minlength=self.n_strata)
+        # Each stratum holds 1/n_strata of the probability mass
+        return (len(strata) / self.n_strata) / counts[strata]
+
+    def estimate(self) -> PkEstimate:
+        w = self._weights()
+        hits = np.asarray(self.hits, dtype=float)
+        misses = np.asarray(self.misses)
+        n = len(hits)
+        n_eff = w.sum()**2 / np.sum(w**2)
+        pk = float(np.sum(w * hits) / w.sum())
+        if self.n_strata > 1:
+            # Stratified variance, smoothed so empty-variance strata do not collapse the interval
+            strata = np.asarray(self.strata)
+            counts = np.bincount(strata, minlength=self.n_strata)
+            p_h = (np.bincount(strata, weights=hits, minlength=self.n_strata) + 0.5) / (counts + 1)
+            se = np.sqrt(np.sum(p_h * (1 - p_h) / counts) / self.n_strata**2)
+            pk_low, pk_high = max(0.0, pk - self.z * se), min(1.0, pk + self.z * se)
+        else:
+            pk_low, pk_high = wilson_interval(pk, n_eff, self.z)
+        # CEP (median miss) with a distribution-free order-statistic interval
+        dq = self.z * 0.5 / np.sqrt(n_eff)
+        cep = weighted_quantile(misses, w, 0.5)
+        cep_low = weighted_quantile(misses, w, 0.5 - dq)
+        cep_high = weighted_quantile(misses, w, 0.5 + dq)
+        converged = n >= self.min_runs and (pk_high - pk_low) <= self.target_width
+        return PkEstimate(n, pk, pk_low, pk_high, cep, cep_low, cep_high, float(n_eff), converged)
+
+    def run(self) -> PkEstimate:
+        while True:
+            n = min(self.batch, self.max_runs - len(self.cases))
+            cases = self._next_cases(n)
+            for case, result in zip(cases, self.evaluate(cases)):
+                self.cases.append(case)
+                self.hits.append(bool(result['hit']))
+                self.misses.append(result['miss'])
+            est = self.estimate()
+            logger.info(f"PK STUDY | N={est.runs} | Pk={est.pk:.3f} [{est.pk_low:.3f}, {est.pk_high:.3f}] "
+                        f"| CEP={est.cep:.2f}m [{est.cep_low:.2f}, {est.cep_high:.2f}]")
+            if est.converged or len(self.cases) >= self.max_runs:
+                return est
+
+def early_termination_report(cases: Sequence[CaseSpec], sim_cfg: SimulationConfig = SimulationConfig(),
+                             radar_cfg: RadarConfig = RadarConfig()) -> dict:
+    """
+    Runs every case with and without early termination and reports how often
+    an early miss was declared for an engagement that the full run intercepted.
+    """
+    early_misses = false_terms = 0
+    t_full = t_early = 0.0
+    reasons: Dict[str, int] = {}
+    for case in cases:
+        full = evaluate_case(dataclasses.replace(case, early_stop=False), sim_cfg, radar_cfg)
+        early = evaluate_case(dataclasses.replace(case, early_stop=True), sim_cfg, radar_cfg)
+        t_full += full['time']
+        t_early += early['time']
+        if early['reason'] not in (full['reason'], 'intercept'):
+            early_misses += 1
+            reasons[early['reason']] = reasons.get(early['reason'], 0) + 1
+            false_terms += int(full['hit'])
+    return {
+        'runs': len(cases),
+        'early_misses': early_misses,
+        'false_terminations': false_terms,
+        'false_termination_rate': false_terms / max(early_misses, 1),
+        'sim_time_saved': 1.0 - t_early / max(t_full, 1e-9),
+        'reasons': reasons,
+    }
+
+def battle_termination_report(scenarios: Sequence[Callable[..., BattleManager]], dt: float = 0.05,
+                              max_time: float = 40.0) -> dict:
+    """
+    6-DOF counterpart of early_termination_report. Each scenario is a factory
+    taking `early_stop` and returning a populated BattleManager; interceptors
+    retired as decided misses are checked against the same interceptor in the
+    full run. Time saved is in simulated interceptor flight time.
+    """
+    interceptors = early_misses = false_terms = 0
+    t_full = t_early = 0.0
+    reasons: Dict[str, int] = {}
+    for build in scenarios:
+        full = build(early_stop=False).run(dt, max_time)
+        early = build(early_stop=True).run(dt, max_time)
+        interceptors += len(full.interceptors)
+        t_full += sum(full.clocks.values())
+        t_early += sum(early.clocks.values())
+        for i_id, reason in early.termination_reasons.items():
+            if reason in ('intercept', 'threat_destroyed'):
+                continue
+            early_misses += 1
+            reasons[reason] = reasons.get(reason, 0) + 1
+            false_terms += int(full.termination_reasons.get(i_id) == 'intercept')
+    return {
+        'runs': len(scenarios),
+        'interceptors': interceptors,
+        'early_misses': early_misses,
+        'false_terminations': false_terms,
+        'false_termination_rate': false_terms / max(early_misses, 1),
+        'flight_time_saved': 1.0 - t_early / max(t_full, 1e-9),
+        'reasons': reasons,
+    }
@@ -0,0 +1,133 @@
+### KineticDefenseSim/src/analysis/tuning.py
+import dataclasses
+import functools
+import logging
+import numpy as np
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+from src.analysis.cache import ResultCache
+from src.analysis.montecarlo import CaseSpec, UnitSampler, evaluate_case, parameter_space
+
+logger = logging.getLogger("KineticDefenseSim")
+
+# Engagement gains searched by default: PN gain, autopilot lag and the g-limit
+GAIN_BOUNDS: Dict[str, tuple] = {
+    'n_gain': (2.0, 8.0),
+    'tau': (0.02, 0.5),
+    'intercept_g': (15.0, 80.0),
+}
+DEFAULT_GAINS: Dict[str, float] = {'n_gain': 5.0, 'tau': 0.05, 'intercept_g': 55.0}
+
+@dataclass(frozen=True)
+class GainScore:
+    gains: Dict[str, float]
+    runs: int
+    pk: float
+    mean_miss: float
+    peak_g: float    # mean over the scenario set of the peak lateral g pulled
+
+def scenario_set(mode: str, n: int, seed: int = 0) -> List[CaseSpec]:
+    """Fixed Sobol' design of scenarios, so every candidate faces the same engagements and noise."""
+    space = parameter_space(mode)
+    cases = []
+    for k, row in enumerate(UnitSampler(len(space), 'sobol', seed).draw(n)):
+        params = {name: lo + r * (hi - lo) for name, r, (lo, hi) in zip(space, row, space.values())}
+        cases.append(CaseSpec(mode, params, k, seed))
+    return cases
+
+def evaluate_gains(candidates: Sequence[Dict[str, float]], scenarios: Sequence[CaseSpec],
+                   cache: Optional[ResultCache] = None, executor: Optional[Executor] = None) -> List[GainScore]:
+    """Scores every candidate on every scenario as one flat batch of engagements."""
+    cases = [dataclasses.replace(case, **gains) for gains in candidates for case in scenarios]
+    run = functools.partial(evaluate_case, cache=cache)
+    if executor is None:
+        results = [run(case) for case in cases]
+    else:
+        results = list(executor.map(run, cases, chunksize=max(1, len(scenarios) // 4)))
+    n = len(scenarios)
+    scores = []
+    for k, gains in enumerate(candidates):
+        block = results[k*n:(k+1)*n]
+        scores.append(GainScore(dict(gains), n, float(np.mean([r['hit'] for r in block])),
+                                float(np.mean([r['miss'] for r in block])),
+                                float(np.mean([r['peak_g'] for r in block]))))
+    return scores
+
+class GainTuner:
+    """
+    Cross-entropy search over guidance gains against a fixed scenario set.
+
+    Each generation samples `population` gain sets from a Gaussian over the
+    normalized bounds, scores them in one parallel batch and refits the
+    Gaussian to the elite fraction. The first generation includes the current
+    defaults as a baseline. Gains are rounded to 4 significant digits, so
+    revisited candidates (and re-runs of a search) are served from the result
+    cache. Objective 'pk' maximizes Pk with mean miss as tie-break, 'miss'
+    minimizes expected miss distance. Every scored candidate is kept for the
+    Pk / g-load Pareto front.
+    """
+
+    def __init__(self, scenarios: Sequence[CaseSpec], bounds: Dict[str, tuple] = GAIN_BOUNDS,
+                 objective: str = 'pk', population: int = 16, generations: int = 6, elite_frac: float = 0.25,
+                 smoothing: float = 0.7, seed: int = 0, workers: Optional[int] = None,
+                 cache: Optional[ResultCache] = None):
+        if objective not in ('pk', 'miss'):
+            raise ValueError(f"Unknown objective: {objective}")
+        self.scenarios = list(scenarios)
+        self.bounds = dict(bounds)
+        self.names = list(self.bounds)
+        self.objective = objective
+        self.population = population
+        self.generations = generations
+        self.n_elite = max(2, int(round(population * elite_frac)))
+        self.smoothing = smoothing
+        self.rng = np.random.default_rng(seed)
+        self.workers = workers
+        self.cache = cache
+        self.history: List[GainScore] = []
+
+    def _to_gains(self, u: np.ndarray) -> Dict[str, float]:
+        return {name: float(f"{lo + x * (hi - lo):.4g}") for name, x, (lo, hi) in zip(self.names, u, self.bounds.values())}
+
+    def _to_unit(self, gains: Dict[str, float]) -> np.ndarray:
+        return np.clip([(gains[name] - lo) / (hi - lo) for name, (lo, hi) in self.bounds.items()], 0.0, 1.0)
+
+    def _rank_key(self, score: GainScore):
+        return (-score.pk, score.mean_miss) if self.objective == 'pk' else (score.mean_miss,)
+
+    def best(self) -> GainScore:
+        return min(self.history, key=self._rank_key)
+
+    def run(self) -> GainScore:
+        mean = self._to_unit({name: DEFAULT_GAINS.get(name, sum(b) / 2) for name, b in self.bounds.items()})
+        std = np.full(len(self.names), 0.25)
+        executor = ProcessPoolExecutor(self.workers) if self.workers != 0 else None
+        try:
+            for gen in range(self.generations):
+                u = np.clip(self.rng.normal(mean, std, (self.population, len(self.names))), 0.0, 1.0)
+                if gen == 0:
+                    u[0] = mean
+                scores = evaluate_gains([self._to_gains(row) for row in u], self.scenarios, self.cache, executor)
+                self.history.extend(scores)
+                order = sorted(range(len(scores)), key=lambda k: self._rank_key(scores[k]))
+                elite = u[order[:self.n_elite]]
+                mean = self.smoothing * elite.mean(axis=0) + (1 - self.smoothing) * mean
+                # Floor keeps the search from collapsing before it has converged on Pk
+                std = np.maximum(self.smoothing * elite.std(axis=0) + (1 - self.smoothing) * std, 0.02)
+                best = self.best()
+                logger.info(f"TUNE | GEN {gen + 1}/{self.generations} | Pk={best.pk:.3f} | Miss={best.mean_miss:.2f}m "
+                            f"| Peak={best.peak_g:.1f}g | {best.gains}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return self.best()
+
+    def pareto_front(self) -> List[GainScore]:
+        """Candidates not beaten on both Pk (higher) and peak g-load (lower), by increasing g-load."""
+        front, best_pk = [], -1.0
+        for score in sorted(self.history, key=lambda s: (s.peak_g, -s.pk)):
+            if score.pk > best_pk:
+                front.append(score)
+                best_pk = score.pk
+        return front
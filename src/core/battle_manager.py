@@ -2,27 +2,56 @@
 import numpy as np
 from typing import List, Dict, Optional
 from src.models.missile import Missile6DOF
-from src.models.threat import Threat
-from src.gnc.guidance import pro_nav_3d
+from src.models.threat import Threat, predict_positions, predict_impact_points
+from src.gnc.guidance import pro_nav_3d, zem_guidance
+from src.gnc.intercept import InterceptSolver, InterceptSolution
 from src.core.types import AeroCoefficients
+from src.core.termination import OutcomePredictor
 
 class BattleManager:
     """
     Orchestrates the engagement: manages entities, sensors, and allocation.
     """
     
-    def __init__(self):
+    KILL_RADIUS = 10.0
+
+    def __init__(self, coarse_factor: int = 4, refine_factor: int = 5, max_step: float = 0.05,
+                 nav_gain: float = 3.0, early_stop: bool = False):
         self.threats: List[Threat] = []
         self.interceptors: List[Missile6DOF] = []
         
         # Mapping: Interceptor ID -> Threat ID
         self.assignments: Dict[int, int] = {}
         
+        # Early-miss predictors per engaged interceptor (only with early_stop), and why each one was retired
+        self.early_stop = early_stop
+        self.predictors: Dict[int, OutcomePredictor] = {}
+        self.termination_reasons: Dict[int, str] = {}
+        
+        # Per-tick time-to-go / PIP solution shared by assignment, guidance and termination
+        self.solver = InterceptSolver()
+        self.intercept: Optional[InterceptSolution] = None
+        self.nav_gain = nav_gain
+        
+        # Multi-rate stepping: interceptors far from (or without) a threat advance in
+        # coarse_factor * dt steps (capped at max_step, the largest step Missile6DOF's
+        # rate damping stays stable with) and resync every coarse_factor frames, which is
+        # also the sensor/assignment period; those near closest approach are refined to
+        # dt / refine_factor. Clocks hold each interceptor's own time.
+        self.coarse_factor = max(1, coarse_factor)
+        self.refine_factor = max(1, refine_factor)
+        self.max_step = max_step
+        self.near_tgo = 2.0
+        self.near_range = 2000.0
+        self.far_tgo = 8.0
+        self.frame = 0
+        self.clocks: Dict[int, float] = {}
+        
         self.next_threat_id = 0
         self.next_interceptor_id = 100
 
-    def spawn_threat(self, position: np.ndarray, velocity: np.ndarray) -> int:
-        t = Threat(self.next_threat_id, position, velocity)
+    def spawn_threat(self, position: np.ndarray, velocity: np.ndarray, model=None) -> int:
+        t = Threat(self.next_threat_id, position, velocity, model)
         self.threats.append(t)
         self.next_threat_id += 1
         return t.id
@@ -48,25 +77,40 @@ class BattleManager:
         self.next_interceptor_id += 1
         return missile.id
 
+    def thrust_profile(self, t_sim: float) -> float:
+        # Simple boost phase
+        return 15000.0 if t_sim < 5.0 else 0.0
+
+    def solve_intercepts(self, t: float) -> InterceptSolution:
+        """Time-to-go / PIP for all active (interceptor, threat) pairs; cached for the tick."""
+        interceptors = [m for m in self.interceptors if m.active]
+        threats = [th for th in self.threats if th.active]
+        self.intercept = self.solver.solve(
+            t,
+            [m.id for m in interceptors],
+            np.array([m.position for m in interceptors]).reshape(-1, 3),
+            np.array([m.velocity for m in interceptors]).reshape(-1, 3),
+            np.array([m.mass for m in interceptors]),
+            self.thrust_profile,
+            threats
+        )
+        return self.intercept
+
     def assign_targets(self):
         """
-        Greedy Allocation: Assign closest free interceptor to closest threat.
-        Refreshes assignments every frame (can be optimized).
+        Greedy Allocation: each free interceptor takes the unengaged threat with
+        the shortest time-to-go, falling back to distance when none is reachable.
         """
         active_threats = [t for t in self.threats if t.active]
-        free_interceptors = [i for i in self.interceptors if i.id not in self.assignments]
+        free_interceptors = [i for i in self.interceptors if i.active and i.id not in self.assignments]
 
         if not active_threats or not free_interceptors:
             return
 
-        # Simple distance-based cost matrix could be used here
-        # For now, just assign first free to first active (FIFO)
-        # TODO: Implement true Priority Queue based on Time-to-Go
-        
         for interceptor in free_interceptors:
-            # Find closest threat
+            # Find soonest reachable threat
             best_threat = None
-            min_dist = float('inf')
+            min_cost = (float('inf'), float('inf'))
             
             for threat in active_threats:
                 # Check if threat is already engaged by another (optional logic)
@@ -79,14 +123,27 @@ class BattleManager:
                 
                 if not is_engaged:
                     dist = np.linalg.norm(interceptor.position - threat.position)
-                    if dist < min_dist:
-                        min_dist = dist
+                    tgo = self.intercept.lookup(interceptor.id, threat.id)[0] if self.intercept else np.inf
+                    if (tgo, dist) < min_cost:
+                        min_cost = (tgo, dist)
                         best_threat = threat
             
             if best_threat:
                 self.assignments[interceptor.id] = best_threat.id
+                if self.early_stop:
+                    # Predictors are updated once per sync period
+                    self.predictors[interceptor.id] = OutcomePredictor(opening_ticks=max(1, 50 // self.coarse_factor))
+
+    def _record_kill(self, interceptor: Missile6DOF, threat: Threat, dist: float):
+        print(f"!!! INTERCEPTION: Interceptor {interceptor.id} hit Threat {threat.id} at dist {dist:.2f}m")
+        threat.active = False
+        # Interceptor is expended with its kill
+        interceptor.active = False
+        self.termination_reasons[interceptor.id] = 'intercept'
+        self.assignments.pop(interceptor.id, None)
+        self.predictors.pop(interceptor.id, None)
 
-    def check_interceptions(self, kill_radius: float = 10.0):
+    def check_interceptions(self, kill_radius: float = KILL_RADIUS):
         for i_id, t_id in list(self.assignments.items()):
             interceptor = next((m for m in self.interceptors if m.id == i_id), None)
             threat = next((t for t in self.threats if t.id == t_id), None)
@@ -94,48 +151,143 @@ class BattleManager:
             if interceptor and threat and threat.active:
                 dist = np.linalg.norm(interceptor.position - threat.position)
                 if dist < kill_radius:
-                    print(f"!!! INTERCEPTION: Interceptor {i_id} hit Threat {t_id} at dist {dist:.2f}m")
-                    threat.active = False
-                    # Remove assignment
-                    del self.assignments[i_id]
+                    self._record_kill(interceptor, threat, dist)
+
+    def predicted_positions(self, t_ahead) -> np.ndarray:
+        """Batched position prediction for every threat (see models.threat.predict_states)."""
+        return predict_positions(self.threats, t_ahead)
+
+    def predicted_impact_points(self):
+        return predict_impact_points(self.threats)
+
+    def retire_decided_misses(self, t: float, thrust_func):
+        """
+        Retires interceptors whose engagement is decided as a miss (only with
+        early_stop) or whose threat is already destroyed, and frees their threat
+        for reassignment. Missile6DOF has no consistent ground reference, so only
+        the kinematic criteria are applied here.
+        """
+        for i_id, t_id in list(self.assignments.items()):
+            interceptor = next((m for m in self.interceptors if m.id == i_id), None)
+            threat = next((th for th in self.threats if th.id == t_id), None)
+            if interceptor is None or threat is None:
+                continue
+            if not threat.active:
+                reason = 'threat_destroyed'
+            elif i_id not in self.predictors:
+                continue
+            else:
+                tgo = self.intercept.lookup(i_id, t_id)[0] if self.intercept else None
+                reason = self.predictors[i_id].update(
+                    threat.position - interceptor.position,
+                    threat.velocity - interceptor.velocity,
+                    interceptor.velocity,
+                    boosting=thrust_func(t) > 0,
+                    tgo=tgo
+                )
+            if reason:
+                interceptor.active = False
+                self.termination_reasons[i_id] = reason
+                del self.assignments[i_id]
+                self.predictors.pop(i_id, None)
+
+    def _substep(self, interceptor: Missile6DOF, threat: Optional[Threat], t: float, dt: float) -> float:
+        """Integration step for this frame, chosen from proximity to the assigned threat."""
+        coarse = max(dt, min(dt * self.coarse_factor, self.max_step))
+        if threat is None or not threat.active:
+            return coarse
+        tgo = self.intercept.lookup(interceptor.id, threat.id)[0] - (t - self.intercept.t)
+        rng = np.linalg.norm(threat.position - interceptor.position)
+        if tgo <= self.near_tgo or rng <= self.near_range:
+            return dt / self.refine_factor
+        if tgo >= self.far_tgo:
+            return coarse
+        return dt
+
+    def _guidance_command(self, interceptor: Missile6DOF, threat: Optional[Threat], t: float) -> np.ndarray:
+        if threat is None or not threat.active:
+            return np.zeros(3)
+        tgo, pip = self.intercept.lookup(interceptor.id, threat.id)
+        tgo -= t - self.intercept.t
+        if np.isfinite(tgo):
+            # Steer out the zero-effort miss at the predicted intercept point
+            return zem_guidance(interceptor.position, interceptor.velocity, pip, tgo, N=self.nav_gain)
+        # pro_nav_3d expects (pos_m, vel_m, pos_t, vel_t, N)
+        return pro_nav_3d(interceptor.position, interceptor.velocity, threat.position, threat.velocity, N=self.nav_gain)
+
+    def _advance(self, interceptor: Missile6DOF, threat: Optional[Threat], t_end: float, h: float,
+                 dt: float, wind_func, thrust_func, fin_func):
+        """Integrates one interceptor from its own clock to t_end in steps of about h."""
+        clock = self.clocks[interceptor.id]
+        n = max(1, int(np.ceil((t_end - clock) / h - 1e-9)))
+        h = (t_end - clock) / n
+        p_start = interceptor.position.copy()
+        for k in range(n):
+            interceptor.rk4_step(clock + k*h, h, wind_func, thrust_func, fin_func, record=False)
+            if n > 1 and threat is not None and threat.active:
+                # Refined closest-approach check between frames. Threats count time from
+                # their own spawn and were already stepped to t_end, so query by offset
+                t_threat = threat.time - (t_end - (clock + (k+1)*h))
+                dist = np.linalg.norm(interceptor.position - threat.state_at(t_threat)[0:3])
+                if dist < self.KILL_RADIUS:
+                    self._record_kill(interceptor, threat, dist)
+                    break
+        self.clocks[interceptor.id] = t_end
+        # One history sample per frame keeps every track aligned for playback
+        frames = max(1, int(round((t_end - clock) / dt)))
+        for k in range(1, frames + 1):
+            interceptor.history.append(p_start + (interceptor.position - p_start) * (k / frames))
 
     def update(self, t: float, dt: float):
         # Define environment/control functions (Placeholders for now)
         wind_func = lambda h: np.zeros(3)
-        thrust_func = lambda t_sim: 15000.0 if t_sim < 5.0 else 0.0 # Simple boost phase
+        thrust_func = self.thrust_profile
         fin_func = lambda *args: None
+        t_end = t + dt
+        # Every interceptor is time-synchronized at the start of a sync period
+        opens_period = self.frame % self.coarse_factor == 0
+        closes_period = (self.frame + 1) % self.coarse_factor == 0
+        self.frame += 1
 
-        # 1. Update Assignments
-        self.assign_targets()
+        # 1. Update Assignments (sensor / assignment boundary)
+        if opens_period:
+            self.solve_intercepts(t)
+            self.assign_targets()
         
-        # 2. Step Threats
+        # 2. Step Threats (closed-form, so always at the frame rate)
         for threat in self.threats:
-            threat.step(dt)
+            if threat.active:
+                threat.step(dt)
             
-        # 3. Step Interceptors
+        # 3. Step Interceptors at their own rate
+        # Interceptors left without a target once every threat is gone are not worth integrating
+        any_threats = any(th.active for th in self.threats)
         for interceptor in self.interceptors:
-            # Determine guidance command
-            target_accel_cmd = np.zeros(3)
-            
-            if interceptor.id in self.assignments:
-                threat_id = self.assignments[interceptor.id]
-                threat = next((t for t in self.threats if t.id == threat_id), None)
-                
-                if threat and threat.active:
-                    # Call Guidance Law
-                    # pro_nav_3d expects (pos_m, vel_m, pos_t, vel_t, N)
-                    target_accel_cmd = pro_nav_3d(
-                        interceptor.position, 
-                        interceptor.velocity, 
-                        threat.position, 
-                        threat.velocity, 
-                        N=3.0
-                    )
+            if not interceptor.active or not any_threats:
+                continue
+            self.clocks.setdefault(interceptor.id, t)
+            threat_id = self.assignments.get(interceptor.id)
+            threat = next((th for th in self.threats if th.id == threat_id), None)
+            h = self._substep(interceptor, threat, t, dt)
+            if h > dt and not closes_period:
+                # Far from anything: lag behind and catch up in large steps at the period end
+                continue
             
-            # Apply Physics Step
+            # Determine guidance command
             # Note: Guidance command is currently calculated but NOT passed to physics
             # Real implementation would map target_accel_cmd -> fin deflections via Control System
-            interceptor.rk4_step(t, dt, wind_func, thrust_func, fin_func)
+            target_accel_cmd = self._guidance_command(interceptor, threat, t)
+            self._advance(interceptor, threat, t_end, h, dt, wind_func, thrust_func, fin_func)
         
         # 4. Check End Conditions
         self.check_interceptions()
+        if closes_period:
+            self.retire_decided_misses(t_end, thrust_func)
+
+    def run(self, dt: float, max_time: float) -> 'BattleManager':
+        """Steps until every threat is down or max_time is reached."""
+        for step in range(int(round(max_time / dt))):
+            self.update(step * dt, dt)
+            if not any(th.active for th in self.threats):
+                break
+        return self
@@ -0,0 +1,46 @@
+### KineticDefenseSim/src/core/checkpoint.py
+import pickle
+import zlib
+import numpy as np
+from typing import Any, Callable, List, Sequence
+
+def pack_history(history: list) -> np.ndarray:
+    """Stacks a list of per-tick vectors into one array (one pickle record instead of thousands)."""
+    if len(history) == 0:
+        return np.empty((0, 0))
+    return np.array(history)
+
+def unpack_history(packed: np.ndarray) -> list:
+    return list(packed)
+
+def snapshot(sim: Any, level: int = 6) -> bytes:
+    """
+    Serializes a complete simulation object (Engagement, BattleManager, ...).
+    Numpy arrays and Generator bit-generator states round-trip exactly, so
+    restoring and continuing reproduces the uninterrupted run bit-for-bit.
+    """
+    return zlib.compress(pickle.dumps(sim, protocol=pickle.HIGHEST_PROTOCOL), level)
+
+def restore(blob: bytes) -> Any:
+    return pickle.loads(zlib.decompress(blob))
+
+def save_checkpoint(sim: Any, path: str):
+    with open(path, 'wb') as f:
+        f.write(snapshot(sim))
+
+def load_checkpoint(path: str) -> Any:
+    with open(path, 'rb') as f:
+        return restore(f.read())
+
+def fork(blob: bytes, variants: Sequence[Callable[[Any], None]]) -> List[Any]:
+    """
+    Branches independent copies from one checkpoint.
+    Each variant is a callable that mutates its copy in place
+    (reseed sensors, change gains, schedule countermeasures, ...).
+    """
+    branches = []
+    for apply in variants:
+        sim = restore(blob)
+        apply(sim)
+        branches.append(sim)
+    return branches
@@ -0,0 +1,67 @@
+### KineticDefenseSim/src/core/rng.py
+import zlib
+import numpy as np
+from typing import Union
+
+def _key_word(part: Union[int, str]) -> int:
+    if isinstance(part, (int, np.integer)) and part >= 0:
+        return int(part)
+    # Strings (and negative ints) map to a stable 32-bit word
+    return zlib.crc32(str(part).encode())
+
+class NoiseStream:
+    """
+    Standard-normal noise pre-generated in blocks and consumed through a cursor.
+    Generator.standard_normal consumes its bit stream sequentially, so the
+    values drawn do not depend on the block size, only on the stream.
+    Pickles as (bit-generator state at block start, cursor), not the block.
+    """
+
+    def __init__(self, rng: np.random.Generator, block: int = 4096):
+        self.rng = rng
+        self.block = block
+        self._refill()
+
+    def _refill(self):
+        self._block_state = self.rng.bit_generator.state
+        self._buf = self.rng.standard_normal(self.block)
+        self._cursor = 0
+
+    def standard_normal(self, n: int) -> np.ndarray:
+        if self._cursor + n <= self.block:
+            out = self._buf[self._cursor:self._cursor + n]
+            self._cursor += n
+            return out
+        head = self._buf[self._cursor:]
+        self._refill()
+        return np.concatenate((head, self.standard_normal(n - len(head))))
+
+    def __getstate__(self):
+        return {'rng_type': type(self.rng.bit_generator), 'block_state': self._block_state,
+                'block': self.block, 'cursor': self._cursor}
+
+    def __setstate__(self, state):
+        bit_gen = state['rng_type']()
+        bit_gen.state = state['block_state']
+        self.rng = np.random.Generator(bit_gen)
+        self.block = state['block']
+        self._refill()
+        self._cursor = state['cursor']
+
+class RngStreams:
+    """
+    Independent counter-based (Philox) streams derived from one master seed.
+    A stream is addressed by a key path such as ('scenario', 12, 'target', 0, 'radar');
+    the same path always yields the same stream, regardless of how many other
+    streams exist or in which order (or in which process) they are created.
+    """
+
+    def __init__(self, master_seed: int):
+        self.master_seed = int(master_seed)
+
+    def generator(self, *path) -> np.random.Generator:
+        seq = np.random.SeedSequence(self.master_seed, spawn_key=tuple(_key_word(p) for p in path))
+        return np.random.Generator(np.random.Philox(seq))
+
+    def noise(self, *path, block: int = 4096) -> NoiseStream:
+        return NoiseStream(self.generator(*path), block)
@@ -0,0 +1,61 @@
+### KineticDefenseSim/src/core/termination.py
+import numpy as np
+from typing import Optional
+from src.legacy.physics import GRAVITY
+
+INTERCEPTOR_GROUND = 'interceptor_ground'
+NO_ENERGY_TO_CLOSE = 'no_energy_to_close'
+OPENING_PAST_CPA = 'opening_past_cpa'
+
+class OutcomePredictor:
+    """
+    Conservative early-miss declaration for one interceptor/threat pair.
+
+    A miss is only declared once the interceptor has stopped boosting, and
+    only for situations it cannot recover from:
+      - it is below ground,
+      - even trading all altitude for speed it cannot match the threat's
+        receding speed along the line of sight (drag only removes energy),
+      - range is opening and the drag-free reach model of the intercept
+        solver finds no intercept within its horizon,
+      - range has been opening for `opening_ticks` consecutive updates and is
+        `opening_margin` beyond the closest approach seen so far.
+    """
+
+    def __init__(self, opening_ticks: int = 50, opening_margin: float = 500.0):
+        self.opening_ticks = opening_ticks
+        self.opening_margin = opening_margin
+        self.min_range = np.inf
+        self.opening_count = 0
+
+    def update(self, r_tm: np.ndarray, v_tm: np.ndarray, vel_i: np.ndarray,
+               boosting: bool, altitude: Optional[float] = None, tgo: Optional[float] = None) -> Optional[str]:
+        """
+        Args:
+            r_tm: Threat position relative to interceptor (m)
+            v_tm: Threat velocity relative to interceptor (m/s)
+            vel_i: Interceptor velocity (m/s)
+            boosting: True while the motor can still add energy
+            altitude: Interceptor altitude (m), None if the frame has no ground reference
+            tgo: Time-to-go from gnc.intercept.InterceptSolver (inf = out of optimistic reach)
+        Returns:
+            Reason string once the engagement is decided as a miss, else None.
+        """
+        range_mag = np.linalg.norm(r_tm)
+        self.min_range = min(self.min_range, range_mag)
+        if altitude is not None and altitude < 0:
+            return INTERCEPTOR_GROUND
+        range_rate = np.dot(r_tm, v_tm) / range_mag if range_mag > 0 else 0.0
+        self.opening_count = self.opening_count + 1 if range_rate > 0 else 0
+        if boosting:
+            return None
+        if altitude is not None and range_mag > 0:
+            v_max = np.sqrt(np.dot(vel_i, vel_i) + 2 * GRAVITY * altitude)
+            receding = np.dot(v_tm + vel_i, r_tm) / range_mag
+            if receding > v_max:
+                return NO_ENERGY_TO_CLOSE
+        if tgo is not None and not np.isfinite(tgo) and range_rate > 0:
+            return NO_ENERGY_TO_CLOSE
+        if self.opening_count >= self.opening_ticks and range_mag > self.min_range + self.opening_margin:
+            return OPENING_PAST_CPA
+        return None
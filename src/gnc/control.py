@@ -2,15 +2,15 @@
 import numpy as np
 
 class Autopilot:
-    def __init__(self, dt: float):
+    def __init__(self, dt: float, Kp: float = 2.0, Kq: float = 0.5, Ki: float = 0.1):
         self.dt = dt
         self.omega_n = 20.0
         self.zeta = 0.7
         self.fin_deflection = np.zeros(3)
         self.fin_rate = np.zeros(3)
-        self.Kp = 2.0
-        self.Kq = 0.5
-        self.Ki = 0.1
+        self.Kp = Kp
+        self.Kq = Kq
+        self.Ki = Ki
         self.err_int = np.zeros(3)
 
     def update(self, cmd_acc_body: np.ndarray, current_acc_body: np.ndarray, rates: np.ndarray):
@@ -8,4 +8,14 @@ def pro_nav_3d(pos_m, vel_m, pos_t, vel_t, N=4.0):
     if range_mag < 0.1: return np.zeros(3)
     omega = np.cross(r_tm, v_tm) / (range_mag**2)
     acc_cmd = N * np.cross(v_tm, omega)
-    return acc_cmd
\ No newline at end of file
+    return acc_cmd
+def zem_guidance(pos_m, vel_m, pip, tgo, N=3.0):
+    """Zero-effort-miss guidance toward a predicted intercept point."""
+    if not np.isfinite(tgo) or tgo < 0.1: return np.zeros(3)
+    zem = pip - (pos_m + vel_m * tgo)
+    v_mag = np.linalg.norm(vel_m)
+    if v_mag > 0.1:
+        # Only the miss normal to the velocity vector can be steered out
+        v_hat = vel_m / v_mag
+        zem = zem - np.dot(zem, v_hat) * v_hat
+    return N * zem / tgo**2
@@ -0,0 +1,123 @@
+### KineticDefenseSim/src/gnc/intercept.py
+import numpy as np
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+from src.legacy.physics import GRAVITY
+from src.models.threat import Threat, predict_positions
+
+@dataclass
+class InterceptSolution:
+    """Time-to-go and predicted intercept point for every (interceptor, threat) pair."""
+    t: float
+    interceptor_ids: List[int]
+    threat_ids: List[int]
+    tgo: np.ndarray         # (n_i, n_t), inf where the threat cannot be reached
+    pip: np.ndarray         # (n_i, n_t, 3), NaN where unreachable
+    converged: np.ndarray   # (n_i, n_t) bool
+
+    def __post_init__(self):
+        self._row = {i: k for k, i in enumerate(self.interceptor_ids)}
+        self._col = {j: k for k, j in enumerate(self.threat_ids)}
+
+    def lookup(self, interceptor_id: int, threat_id: int) -> Tuple[float, np.ndarray]:
+        r, c = self._row.get(interceptor_id), self._col.get(threat_id)
+        if r is None or c is None:
+            return np.inf, np.full(3, np.nan)
+        return self.tgo[r, c], self.pip[r, c]
+
+class InterceptSolver:
+    """
+    Batched predicted-intercept-point solver.
+
+    The interceptor's reach is modelled along its flight path: current speed
+    plus the remaining boost (thrust_func / mass, cut off when fuel runs out)
+    plus the most gravity could add (g per second, as if always diving along
+    the flight path), ignoring drag. Frames differ in which way gravity points
+    (Missile6DOF uses +z down), so the bound does not assume a direction. It is
+    optimistic, so "unreachable" is a safe conclusion. For every pair the
+    fixed point of
+
+        tgo = s_i^-1( |p_t(t + tgo) - p_i| )
+
+    is iterated with a convergence mask, where s_i(tau) is the distance the
+    interceptor can cover in tau seconds and threats are propagated with
+    models.threat.predict_positions. Results are cached per tick so
+    assignment, guidance and termination logic share one solve.
+    """
+
+    def __init__(self, horizon: float = 120.0, grid_dt: float = 0.1, tol: float = 1e-3, max_iter: int = 30,
+                 gravity: float = GRAVITY):
+        self.tau = np.arange(0.0, horizon + grid_dt, grid_dt)
+        self.gravity = gravity
+        self.tol = tol
+        self.max_iter = max_iter
+        self._cached: Optional[InterceptSolution] = None
+
+    def _reach(self, t: float, speeds: np.ndarray, masses: np.ndarray, thrust_func: Callable,
+               burn_left: Optional[np.ndarray]) -> np.ndarray:
+        """Cumulative reachable path length s_i(tau) on the tau grid, shape (n_i, K)."""
+        thrust = np.array([thrust_func(t + tau) for tau in self.tau])
+        accel = thrust[None, :] / masses[:, None]
+        if burn_left is not None:
+            accel = np.where(self.tau[None, :] < burn_left[:, None], accel, 0.0)
+        accel = accel + self.gravity
+        d_tau = np.diff(self.tau)
+        dv = 0.5 * (accel[:, 1:] + accel[:, :-1]) * d_tau
+        v = speeds[:, None] + np.concatenate([np.zeros((len(speeds), 1)), np.cumsum(dv, axis=1)], axis=1)
+        ds = 0.5 * (v[:, 1:] + v[:, :-1]) * d_tau
+        return np.concatenate([np.zeros((len(speeds), 1)), np.cumsum(ds, axis=1)], axis=1)
+
+    def _invert(self, s: np.ndarray, dist: np.ndarray) -> np.ndarray:
+        """Batched s_i^-1(dist_ij): rows are offset so one searchsorted covers all interceptors."""
+        n_i, k = s.shape
+        span = s[:, -1].max() + 1.0
+        offsets = np.arange(n_i)[:, None] * span
+        flat = (s + offsets).ravel()
+        idx = np.searchsorted(flat, (dist + offsets).ravel()).reshape(dist.shape)
+        row = np.arange(n_i)[:, None]
+        reachable = dist <= s[:, -1:]
+        hi = np.clip(idx - row * k, 1, k - 1)
+        s0, s1 = s[row, hi - 1], s[row, hi]
+        frac = np.where(s1 > s0, (dist - s0) / np.where(s1 > s0, s1 - s0, 1.0), 0.0)
+        tau = self.tau[hi - 1] + np.clip(frac, 0.0, 1.0) * (self.tau[hi] - self.tau[hi - 1])
+        return np.where(reachable, tau, np.inf)
+
+    def solve(self, t: float, interceptor_ids: Sequence[int], positions: np.ndarray, velocities: np.ndarray,
+              masses: np.ndarray, thrust_func: Callable, threats: List[Threat],
+              burn_left: Optional[np.ndarray] = None) -> InterceptSolution:
+        key_i, key_t = list(interceptor_ids), [th.id for th in threats]
+        c = self._cached
+        if c is not None and c.t == t and c.interceptor_ids == key_i and c.threat_ids == key_t:
+            return c
+        n_i, n_t = len(key_i), len(key_t)
+        if n_i == 0 or n_t == 0:
+            self._cached = InterceptSolution(t, key_i, key_t, np.full((n_i, n_t), np.inf),
+                                             np.full((n_i, n_t, 3), np.nan), np.zeros((n_i, n_t), dtype=bool))
+            return self._cached
+        positions = np.asarray(positions, dtype=float)
+        s = self._reach(t, np.linalg.norm(velocities, axis=1), np.asarray(masses, dtype=float), thrust_func, burn_left)
+        horizon = self.tau[-1]
+        pos_t = np.broadcast_to(np.array([th.position for th in threats])[None], (n_i, n_t, 3))
+        tgo = self._invert(s, np.linalg.norm(pos_t - positions[:, None], axis=2))
+        # Out of reach right now may still be reachable later for a closing threat
+        tgo = np.where(np.isfinite(tgo), tgo, horizon)
+        done = np.zeros((n_i, n_t), dtype=bool)
+        converged = np.zeros((n_i, n_t), dtype=bool)
+        for _ in range(self.max_iter):
+            if done.all():
+                break
+            pos_t = predict_positions(threats, np.minimum(tgo, horizon).T).transpose(1, 0, 2)
+            new = self._invert(s, np.linalg.norm(pos_t - positions[:, None], axis=2))
+            with np.errstate(invalid='ignore'):
+                # inf - inf on pairs already settled as unreachable
+                step = np.abs(new - tgo)
+            active = ~done
+            tgo = np.where(active, new, tgo)
+            newly = active & (~np.isfinite(new) | (step < self.tol))
+            converged |= newly & np.isfinite(new)
+            done |= newly
+        # Pairs still oscillating after max_iter keep their last iterate but stay unconverged
+        pip = predict_positions(threats, np.where(np.isfinite(tgo), tgo, 0.0).T).transpose(1, 0, 2)
+        pip = np.where(np.isfinite(tgo)[..., None], pip, np.nan)
+        self._cached = InterceptSolution(t, key_i, key_t, tgo, pip, converged)
+        return self._cached
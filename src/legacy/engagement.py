@@ -0,0 +1,178 @@
+### KineticDefenseSim/src/legacy/engagement.py
+import logging
+import numpy as np
+from typing import Optional
+from src.legacy.entities import Projectile, Interceptor, ManeuveringDrone
+from src.legacy.guidance import augmented_proportional_navigation, limit_g_load
+from src.legacy.config import SimulationConfig, RadarConfig
+from src.legacy.sensors import Radar
+from src.legacy.estimation import KalmanFilter
+from src.core import checkpoint
+from src.core.rng import RngStreams
+from src.core.termination import OutcomePredictor, INTERCEPTOR_GROUND
+
+logger = logging.getLogger("KineticDefenseSim")
+
+# Uniform parameter ranges, in the order generate_scenario draws them
+SCENARIO_BOUNDS = {
+    'ballistic': {
+        'dist': (20000.0, 35000.0),
+        'angle_deg': (40.0, 60.0),
+        'speed_factor': (1.1, 1.3),
+        'azimuth': (0.0, 2*np.pi),
+    },
+    'dogfight': {
+        'dist': (12000.0, 25000.0),
+        'alt': (2000.0, 8000.0),
+        'azimuth': (0.0, 2*np.pi),
+        'speed': (270.0, 680.0),
+        'offset_x': (-3000.0, 3000.0),
+        'offset_y': (-3000.0, 3000.0),
+    },
+}
+
+def build_scenario(mode, params, seed=None):
+    """
+    Builds the threat for explicit scenario parameters (see SCENARIO_BOUNDS).
+    `seed` drives the drone's maneuver and may be an int or a Generator.
+    """
+    if mode == 'ballistic':
+        dist = params['dist']
+        angle = np.deg2rad(params['angle_deg'])
+        speed = np.sqrt(dist * 9.81 / np.sin(2*angle)) * params['speed_factor']
+        azimuth = params['azimuth']
+        spawn_pos = [dist * np.cos(azimuth), dist * np.sin(azimuth), 0]
+        v_rad = -speed * np.cos(angle)
+        v_z = speed * np.sin(angle)
+        vel = [v_rad * np.cos(azimuth), v_rad * np.sin(azimuth), v_z]
+        return Projectile(spawn_pos, vel, mass=300.0, cd=0.2, area=0.1)
+    dist = params['dist']
+    azimuth = params['azimuth']
+    spawn_pos = [dist * np.cos(azimuth), dist * np.sin(azimuth), params['alt']]
+    target_point = np.array([params['offset_x'], params['offset_y'], 0])
+    curr_pos = np.array(spawn_pos)
+    direction = target_point - curr_pos
+    direction = direction / np.linalg.norm(direction)
+    vel = direction * params['speed']
+    return ManeuveringDrone(spawn_pos, vel, seed=seed, g_load=params.get('g_load'))
+
+def generate_scenario(mode, seed):
+    rng = np.random.default_rng(seed)
+    if mode == 'random':
+        mode = rng.choice(['dogfight', 'ballistic'])
+    logger.info(f"GENERATING SCENARIO: {mode.upper()} | SEED: {seed}")
+    params = {name: rng.uniform(lo, hi) for name, (lo, hi) in SCENARIO_BOUNDS[mode].items()}
+    return build_scenario(mode, params, seed)
+
+class Engagement:
+    """
+    Single threat vs. single interceptor engagement (3-DOF visual mode).
+    Holds the complete mutable simulation state so it can be checkpointed,
+    restored bit-exactly and forked into variants mid-flight.
+    """
+
+    def __init__(self, target: Projectile, sim_cfg: SimulationConfig = SimulationConfig(),
+                 radar_cfg: RadarConfig = RadarConfig(), intercept_g: float = 55.0,
+                 n_gain: float = 5.0, streams: Optional[RngStreams] = None, max_time: float = 90.0,
+                 seed: Optional[int] = None, early_stop: bool = False, tau: float = 0.05):
+        self.seed = seed
+        self.target = target
+        self.interceptor = Interceptor(pos=[0, 0, 0], vel=[0.01, 0.01, 100], tau=tau)
+        self.sim_cfg = sim_cfg
+        self.radar_cfg = radar_cfg
+        self.intercept_g = intercept_g
+        self.n_gain = n_gain
+        self.max_time = max_time
+        # Sensor noise comes from its own keyed stream, so it is reproducible from the master seed
+        self.streams = streams
+        stream = streams.noise('scenario', seed or 0, 'target', 0, 'radar') if streams else None
+        self.radar = Radar(radar_cfg, stream=stream)
+        self.kf = KalmanFilter(sim_cfg.DT, radar_cfg.POS_NOISE_STD, radar_cfg.VEL_NOISE_STD)
+        self.kf.x = self.radar.measure(target.state)
+        self.time = 0.0
+        self.running = True
+        self.intercepted = False
+        self.miss_distance = np.inf
+        # Largest lateral acceleration the airframe actually pulled (g)
+        self.peak_g = 0.0
+        self.termination_reason = None
+        self.predictor = OutcomePredictor() if early_stop else None
+        self.est_history = []
+
+    def _guidance(self, r, v):
+        cmd = augmented_proportional_navigation(r, v, n_gain=self.n_gain)
+        return limit_g_load(cmd, max_g=self.intercept_g)
+
+    def step(self):
+        dt = self.sim_cfg.DT
+        self.target.update(dt)
+        meas = self.radar.measure(self.target.state)
+        self.kf.predict()
+        self.kf.update(meas)
+        est_state = self.kf.get_state()
+        self.est_history.append(est_state[:3])
+        if self.interceptor.active:
+            self.interceptor.update_guidance(dt, est_state[:3], est_state[3:], self._guidance)
+            self.peak_g = max(self.peak_g, np.linalg.norm(self.interceptor.realized_acc) / 9.80665)
+            dist = np.linalg.norm(self.interceptor.state[:3] - self.target.state[:3])
+            self.miss_distance = min(self.miss_distance, dist)
+            if dist < 15.0:
+                logger.info(f"SPLASH | T={self.time:.2f}s | Miss={dist:.2f}m")
+                self.intercepted = True
+                self.running = False
+                self.termination_reason = 'intercept'
+        if self.running and self.predictor is not None:
+            reason = self._predict_miss()
+            if reason:
+                logger.info(f"EARLY MISS | T={self.time:.2f}s | {reason.upper()} | Miss={self.miss_distance:.2f}m")
+                self.running = False
+                self.termination_reason = reason
+        if self.target.state[2] < 0:
+            logger.info("TARGET GROUND IMPACT")
+            self.running = False
+            self.termination_reason = self.termination_reason or 'target_ground_impact'
+        self.time += dt
+        if self.running and self.time >= self.max_time:
+            self.termination_reason = 'timeout'
+
+    def _predict_miss(self) -> Optional[str]:
+        if not self.interceptor.active:
+            return INTERCEPTOR_GROUND
+        p_int, v_int = self.interceptor.state[:3], self.interceptor.state[3:]
+        return self.predictor.update(self.target.state[:3] - p_int, self.target.state[3:] - v_int, v_int,
+                                     boosting=self.interceptor.fuel_mass > 0, altitude=p_int[2])
+
+    @property
+    def done(self) -> bool:
+        return not self.running or self.time >= self.max_time
+
+    def run(self, until: Optional[float] = None) -> 'Engagement':
+        """Steps to completion, or until simulation time reaches `until`."""
+        while not self.done and (until is None or self.time < until):
+            self.step()
+        return self
+
+    def reseed(self, branch: int):
+        """
+        Replaces the radar noise stream, e.g. to branch Monte Carlo variants.
+        Branch streams are keyed under this engagement's radar path, so they
+        stay derived from the master seed and never collide with other runs.
+        """
+        streams = getattr(self, 'streams', None) or RngStreams(self.seed or 0)
+        self.radar.reseed(streams.noise('scenario', self.seed or 0, 'target', 0, 'radar', 'fork', branch))
+
+    def snapshot(self) -> bytes:
+        return checkpoint.snapshot(self)
+
+    @staticmethod
+    def restore(blob: bytes) -> 'Engagement':
+        return checkpoint.restore(blob)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['est_history'] = checkpoint.pack_history(self.est_history)
+        return state
+
+    def __setstate__(self, state):
+        state['est_history'] = checkpoint.unpack_history(state['est_history'])
+        self.__dict__.update(state)
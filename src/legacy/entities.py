@@ -1,6 +1,7 @@
 ### KineticDefenseSim/src/legacy/entities.py
 import numpy as np
 from src.legacy.physics import rk4_integration
+from src.core.checkpoint import pack_history, unpack_history
 
 class Projectile:
     def __init__(self, pos, vel, mass=40.0, cd=0.3, area=0.1):
@@ -11,6 +12,15 @@ class Projectile:
         self.active = True
         self.history = [self.state[:3]]
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['history'] = pack_history(self.history)
+        return state
+
+    def __setstate__(self, state):
+        state['history'] = unpack_history(state['history'])
+        self.__dict__.update(state)
+
     def _no_thrust(self, t, v):
         return np.zeros(3)
 
@@ -21,8 +31,10 @@ class Projectile:
         if self.state[2] < 0: 
             self.active = False
 
+DRONE_G_LOAD_RANGE = (4.0, 9.0)
+
 class ManeuveringDrone(Projectile):
-    def __init__(self, pos, vel, seed=None):
+    def __init__(self, pos, vel, seed=None, g_load=None):
         super().__init__(pos, vel, mass=200.0, cd=0.04, area=0.4)
         self.time = 0.0
         rng = np.random.default_rng(seed)
@@ -30,7 +42,9 @@ class ManeuveringDrone(Projectile):
         self.omega_y = rng.uniform(0.3, 1.2)
         self.phase_x = rng.uniform(0, 2*np.pi)
         self.phase_y = rng.uniform(0, 2*np.pi)
-        self.g_load = rng.uniform(4.0, 9.0)
+        self.g_load = rng.uniform(*DRONE_G_LOAD_RANGE)
+        if g_load is not None:
+            self.g_load = g_load
 
     def _evasive_pilot(self, t, vel):
         g_force = np.array([0, 0, 9.80665 * self.mass])
@@ -59,7 +73,7 @@ class ManeuveringDrone(Projectile):
         if self.state[2] < 0: self.active = False
 
 class Interceptor(Projectile):
-    def __init__(self, pos, vel):
+    def __init__(self, pos, vel, tau=0.05):
         super().__init__(pos, vel, mass=90.0, cd=0.25, area=0.02)
         self.dry_mass = 40.0
         self.fuel_mass = 50.0
@@ -69,7 +83,7 @@ class Interceptor(Projectile):
         self.command_acc = np.zeros(3)
         self.realized_acc = np.zeros(3) 
         self.time_elapsed = 0.0
-        self.tau = 0.05 
+        self.tau = tau
 
     def _thrust_control_law(self, t, vel):
         thrust_vec = np.zeros(3)
@@ -1,14 +1,16 @@
 ### KineticDefenseSim/src/legacy/sensors.py
 import numpy as np
 from src.legacy.config import RadarConfig
+from src.core.rng import NoiseStream
 
 class Radar:
-    def __init__(self, config: RadarConfig):
+    def __init__(self, config: RadarConfig, seed=None, stream: NoiseStream = None):
         self.config = config
-        self.rng = np.random.default_rng()
+        self.sigma = np.array([config.POS_NOISE_STD]*3 + [config.VEL_NOISE_STD]*3)
+        self.noise = stream or NoiseStream(np.random.default_rng(seed))
+
+    def reseed(self, stream: NoiseStream):
+        self.noise = stream
 
     def measure(self, true_state: np.ndarray) -> np.ndarray:
-        noise_pos = self.rng.normal(0, self.config.POS_NOISE_STD, 3)
-        noise_vel = self.rng.normal(0, self.config.VEL_NOISE_STD, 3)
-        noise = np.concatenate((noise_pos, noise_vel))
-        return true_state + noise
\ No newline at end of file
+        return true_state + self.noise.standard_normal(6) * self.sigma
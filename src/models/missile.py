@@ -2,6 +2,7 @@
 import numpy as np
 from src.core.types import AeroCoefficients
 from src.physics.environment import Atmosphere
+from src.core.checkpoint import pack_history, unpack_history
 
 class Missile6DOF:
     def __init__(self, pos, vel, mass_props, aero_props: AeroCoefficients):
@@ -12,8 +13,18 @@ class Missile6DOF:
         self.inertia = mass_props['inertia']
         self.aero = aero_props
         self.fuel_mass = mass_props.get('fuel', 0.0)
+        self.active = True
         self.history = []
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['history'] = pack_history(self.history)
+        return state
+
+    def __setstate__(self, state):
+        state['history'] = unpack_history(state['history'])
+        self.__dict__.update(state)
+
     @property
     def position(self) -> np.ndarray:
         return self.state[0:3]
@@ -69,10 +80,11 @@ class Missile6DOF:
         psi_dot = (q*s_ph + r*c_ph) / c_th
         return np.concatenate((pos_dot, vel_dot, np.array([phi_dot, theta_dot, psi_dot]), rates_dot))
 
-    def rk4_step(self, t, dt, wind_func, thrust_func, fin_func):
+    def rk4_step(self, t, dt, wind_func, thrust_func, fin_func, record=True):
         k1 = self.equations_of_motion(t, self.state, wind_func, thrust_func, fin_func)
         k2 = self.equations_of_motion(t + 0.5*dt, self.state + 0.5*dt*k1, wind_func, thrust_func, fin_func)
         k3 = self.equations_of_motion(t + 0.5*dt, self.state + 0.5*dt*k2, wind_func, thrust_func, fin_func)
         k4 = self.equations_of_motion(t + dt, self.state + dt*k3, wind_func, thrust_func, fin_func)
         self.state += (dt/6.0) * (k1 + 2*k2 + 2*k3 + k4)
-        self.history.append(self.state[0:3].copy())
\ No newline at end of file
+        if record:
+            self.history.append(self.state[0:3].copy())
\ No newline at end of file
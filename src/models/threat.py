@@ -1,24 +1,152 @@
 ### src/models/threat.py
 import numpy as np
-from typing import Tuple
+from collections import OrderedDict
+from typing import List, Sequence, Tuple
+from src.legacy.physics import GRAVITY, rk4_integration
+
+class KinematicModel:
+    """
+    Closed-form constant-acceleration motion: p(t) = p0 + v0*t + a*t^2/2.
+    Covers constant velocity (a = 0) and drag-free ballistic flight (a = -g z).
+    """
+
+    def __init__(self, accel: Sequence[float] = (0.0, 0.0, 0.0)):
+        self.accel = np.asarray(accel, dtype=float)
+
+    def state_at(self, initial: np.ndarray, t) -> np.ndarray:
+        """State [x, y, z, vx, vy, vz] at time(s) t after `initial`; t may be an array."""
+        t = np.asarray(t, dtype=float)[..., None]
+        pos = initial[0:3] + initial[3:6] * t + 0.5 * self.accel * t**2
+        vel = initial[3:6] + self.accel * t
+        return np.concatenate([pos, vel], axis=-1)
+
+    def impact_time(self, state: np.ndarray) -> float:
+        """Time until z reaches 0 from `state`, inf if it never does."""
+        z, vz, az = state[2], state[5], self.accel[2]
+        if abs(az) < 1e-12:
+            return -z / vz if vz < 0 else np.inf
+        disc = vz**2 - 2 * az * z
+        if disc < 0:
+            return np.inf
+        roots = np.array([(-vz - np.sqrt(disc)) / az, (-vz + np.sqrt(disc)) / az])
+        roots = roots[roots > 0]
+        return float(roots.min()) if len(roots) else np.inf
+
+class ConstantVelocityModel(KinematicModel):
+    def __init__(self):
+        super().__init__((0.0, 0.0, 0.0))
+
+class BallisticModel(KinematicModel):
+    def __init__(self, gravity: float = GRAVITY):
+        super().__init__((0.0, 0.0, -gravity))
+
+# LRU of integrated tables; a full 600 s table is about 0.6 MB
+TABLE_CACHE_SIZE = 64
+_TABLE_CACHE: 'OrderedDict[tuple, Tuple[np.ndarray, np.ndarray]]' = OrderedDict()
+
+class DragBallisticTable:
+    """
+    Drag-ballistic trajectory (legacy atmosphere and Mach-dependent drag)
+    integrated once at launch and then queried by Hermite interpolation.
+    Tables are memoized on (initial state, mass, cd, area, dt): the model keeps
+    the tables of its own threats, and a bounded LRU shares them across runs,
+    so replays reuse them without long-lived processes growing without limit.
+    """
+
+    def __init__(self, mass: float = 300.0, cd: float = 0.2, area: float = 0.1,
+                 table_dt: float = 0.05, t_max: float = 600.0):
+        self.mass = mass
+        self.cd = cd
+        self.area = area
+        self.table_dt = table_dt
+        self.t_max = t_max
+        self._tables = {}
+
+    def __getstate__(self):
+        # Tables are rebuilt on demand rather than stored in checkpoints
+        state = self.__dict__.copy()
+        state['_tables'] = {}
+        return state
+
+    def _no_thrust(self, t, v):
+        return np.zeros(3)
+
+    def table(self, initial: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        key = (tuple(initial), self.mass, self.cd, self.area, self.table_dt, self.t_max)
+        if key in self._tables:
+            return self._tables[key]
+        if key in _TABLE_CACHE:
+            _TABLE_CACHE.move_to_end(key)
+        else:
+            states = [np.asarray(initial, dtype=float)]
+            # Integrate a little past ground impact so impact queries can interpolate
+            while len(states) * self.table_dt < self.t_max and states[-1][2] >= 0:
+                states.append(rk4_integration(states[-1], self.table_dt, self.mass, self.cd, self.area, self._no_thrust))
+            states = np.array(states)
+            _TABLE_CACHE[key] = (np.arange(len(states)) * self.table_dt, states)
+            while len(_TABLE_CACHE) > TABLE_CACHE_SIZE:
+                _TABLE_CACHE.popitem(last=False)
+        self._tables[key] = _TABLE_CACHE[key]
+        return self._tables[key]
+
+    def state_at(self, initial: np.ndarray, t) -> np.ndarray:
+        times, states = self.table(initial)
+        t = np.clip(np.asarray(t, dtype=float), 0.0, times[-1])
+        i = np.minimum((t / self.table_dt).astype(int), len(times) - 2)
+        s = ((t - times[i]) / self.table_dt)[..., None]
+        h = self.table_dt
+        p0, v0 = states[i, 0:3], states[i, 3:6]
+        p1, v1 = states[i + 1, 0:3], states[i + 1, 3:6]
+        # Cubic Hermite on position with its exact derivative for velocity
+        h00, h10, h01, h11 = 2*s**3 - 3*s**2 + 1, s**3 - 2*s**2 + s, -2*s**3 + 3*s**2, s**3 - s**2
+        pos = h00*p0 + h10*h*v0 + h01*p1 + h11*h*v1
+        d00, d10, d01, d11 = 6*s**2 - 6*s, 3*s**2 - 4*s + 1, -6*s**2 + 6*s, 3*s**2 - 2*s
+        vel = (d00*p0 + d01*p1) / h + d10*v0 + d11*v1
+        return np.concatenate([pos, vel], axis=-1)
+
+    def impact_time(self, initial: np.ndarray, t_now: float) -> float:
+        """Time after `t_now` until z reaches 0, inf if not within the table."""
+        times, states = self.table(initial)
+        below = np.nonzero((states[:, 2] < 0) & (times > t_now))[0]
+        if len(below) == 0:
+            return np.inf
+        k = below[0]
+        z0, z1 = states[k - 1, 2], states[k, 2]
+        return max(times[k - 1] + self.table_dt * z0 / (z0 - z1) - t_now, 0.0)
 
 class Threat:
     """
     Represents an incoming threat with 3-DOF kinematics.
-    Modeled as a point mass with constant velocity (can be extended to maneuvering).
+    Propagated by a motion model that can jump straight to any time, so a tick
+    costs one closed-form evaluation (or table lookup) instead of an RK4 step.
+    Defaults to constant velocity.
     """
 
-    def __init__(self, threat_id: int, position: np.ndarray, velocity: np.ndarray):
+    def __init__(self, threat_id: int, position: np.ndarray, velocity: np.ndarray, model=None):
         """
         Args:
             threat_id: Unique identifier
             position: Initial position [x, y, z] (m)
             velocity: Initial velocity [vx, vy, vz] (m/s)
+            model: KinematicModel or DragBallisticTable (default: constant velocity)
         """
         self.id = threat_id
-        self.state = np.concatenate([position, velocity])  # [x, y, z, vx, vy, vz]
+        self.model = model or ConstantVelocityModel()
+        self.initial = np.concatenate([position, velocity]).astype(float)  # [x, y, z, vx, vy, vz]
+        self.state = self.initial.copy()
+        self.time = 0.0
         self.active = True
-        self.history = [self.state.copy()]
+        # Only tick times are recorded; states are regenerated on demand
+        self._times = [0.0]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_times'] = np.array(self._times)
+        return state
+
+    def __setstate__(self, state):
+        state['_times'] = list(state['_times'])
+        self.__dict__.update(state)
 
     @property
     def position(self) -> np.ndarray:
@@ -28,24 +156,62 @@ class Threat:
     def velocity(self) -> np.ndarray:
         return self.state[3:6]
 
-    def equations_of_motion(self, t: float, state: np.ndarray) -> np.ndarray:
-        """
-        Simple ballistic/linear motion model.
-        d/dt [pos, vel] = [vel, 0] (for constant velocity)
-        """
-        # dx/dt = v
-        # dv/dt = 0 (gravity/drag can be added here)
-        return np.concatenate([state[3:6], np.zeros(3)])
+    @property
+    def history(self) -> np.ndarray:
+        return self.model.state_at(self.initial, np.array(self._times))
 
-    def step(self, dt: float):
-        """RK4 integration step"""
+    def state_at(self, t):
+        """State at absolute threat time(s) t."""
+        return self.model.state_at(self.initial, t)
+
+    def advance_to(self, t: float):
         if not self.active:
             return
+        self.time = t
+        self.state = self.model.state_at(self.initial, t)
+        self._times.append(t)
+
+    def step(self, dt: float):
+        self.advance_to(self.time + dt)
+
+def predict_states(threats: List[Threat], t_ahead) -> np.ndarray:
+    """
+    Predicted states of all threats `t_ahead` seconds past their current time.
+    t_ahead is a scalar, shape (n,) or shape (n, k); the result has shape
+    (n, 6) or (n, k, 6). Kinematic models are evaluated in one batch.
+    """
+    n = len(threats)
+    t_ahead = np.asarray(t_ahead, dtype=float)
+    squeeze = t_ahead.ndim < 2
+    t = np.broadcast_to(t_ahead, (n,))[:, None] if squeeze else t_ahead
+    out = np.empty(t.shape + (6,))
+    kin = np.array([isinstance(th.model, KinematicModel) for th in threats], dtype=bool)
+    if kin.any():
+        idx = np.nonzero(kin)[0]
+        init = np.array([threats[i].initial for i in idx])
+        acc = np.array([threats[i].model.accel for i in idx])
+        tt = t[idx] + np.array([threats[i].time for i in idx])[:, None]
+        out[idx, :, 0:3] = init[:, None, 0:3] + init[:, None, 3:6] * tt[..., None] + 0.5 * acc[:, None] * tt[..., None]**2
+        out[idx, :, 3:6] = init[:, None, 3:6] + acc[:, None] * tt[..., None]
+    for i in np.nonzero(~kin)[0]:
+        out[i] = threats[i].state_at(threats[i].time + t[i])
+    return out[:, 0] if squeeze else out
 
-        k1 = self.equations_of_motion(0, self.state)
-        k2 = self.equations_of_motion(0, self.state + dt/2 * k1)
-        k3 = self.equations_of_motion(0, self.state + dt/2 * k2)
-        k4 = self.equations_of_motion(0, self.state + dt * k3)
+def predict_positions(threats: List[Threat], t_ahead) -> np.ndarray:
+    return predict_states(threats, t_ahead)[..., 0:3]
 
-        self.state = self.state + (dt/6) * (k1 + 2*k2 + 2*k3 + k4)
-        self.history.append(self.state.copy())
+def predict_impact_points(threats: List[Threat]) -> Tuple[np.ndarray, np.ndarray]:
+    """Ground impact points (n, 3) and times-to-impact (n,); NaN / inf where there is none."""
+    t_imp = np.empty(len(threats))
+    for k, th in enumerate(threats):
+        if isinstance(th.model, KinematicModel):
+            t_imp[k] = th.model.impact_time(th.state)
+        else:
+            t_imp[k] = th.model.impact_time(th.initial, th.time)
+    points = np.full((len(threats), 3), np.nan)
+    hit = np.isfinite(t_imp)
+    if hit.any():
+        sub = [th for th, h in zip(threats, hit) if h]
+        points[hit] = predict_positions(sub, t_imp[hit])
+        points[hit, 2] = 0.0
+    return points, t_imp
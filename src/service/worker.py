@@ -0,0 +1,214 @@
+### KineticDefenseSim/src/service/worker.py
+import io
+import json
+import logging
+import multiprocessing
+import os
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from typing import Iterable, Iterator, List, Optional, TextIO
+from src.legacy.config import SimulationConfig, RadarConfig
+from src.legacy.engagement import Engagement, generate_scenario
+from src.core.rng import RngStreams
+from src.analysis.cache import PROJECT_ROOT, ResultCache, source_fingerprint
+from src.analysis.montecarlo import CaseSpec, evaluate_case
+
+logger = logging.getLogger("KineticDefenseSim")
+
+# Per-process state, set up once by init_worker and reused by every job
+_CACHE: Optional[ResultCache] = None
+
+def init_worker(cache_dir: Optional[str] = None):
+    """Pool initializer: engine modules are already imported; open the cache and hash the sources once."""
+    global _CACHE
+    _CACHE = ResultCache(cache_dir) if cache_dir else None
+    source_fingerprint()
+
+def run_seed(mode: str, seed: int, intercept_g: float = 55.0, n_gain: float = 5.0, early_stop: bool = True,
+             cache: Optional[ResultCache] = None, tau: float = 0.05) -> dict:
+    """Same run as `main.py --headless --seed`, sharing its cache entries."""
+    sim_cfg, radar_cfg = SimulationConfig(), RadarConfig()
+    if cache is not None:
+        key = cache.key(kind='run', mode=mode, seed=seed, sim_cfg=sim_cfg, radar_cfg=radar_cfg,
+                        intercept_g=intercept_g, n_gain=n_gain, tau=tau, early_stop=early_stop)
+        summary = cache.get(key)
+        if summary is not None:
+            return summary
+    sim = Engagement(generate_scenario(mode, seed), sim_cfg, radar_cfg, intercept_g=intercept_g, n_gain=n_gain,
+                     streams=RngStreams(seed), seed=seed, early_stop=early_stop, tau=tau).run()
+    summary = {'hit': sim.intercepted, 'miss': float(sim.miss_distance), 'time': sim.time,
+               'reason': sim.termination_reason, 'peak_g': sim.peak_g}
+    if cache is not None:
+        cache.put(key, summary)
+    return summary
+
+def run_job(job: dict, cache: Optional[ResultCache] = None) -> dict:
+    """
+    Job fields: seed (required), mode, intercept_g, n_gain, tau, full_run.
+    With `params` (scenario parameters, see montecarlo.parameter_space) the
+    job is a Monte Carlo case instead and `master_seed` selects the streams.
+    """
+    mode = job.get('mode', 'random')
+    seed = int(job['seed'])
+    intercept_g = float(job.get('intercept_g', 55.0))
+    n_gain = float(job.get('n_gain', 5.0))
+    tau = float(job.get('tau', 0.05))
+    early_stop = not job.get('full_run', False)
+    if 'params' in job:
+        case = CaseSpec(mode, {k: float(v) for k, v in job['params'].items()}, seed,
+                        int(job.get('master_seed', 0)), intercept_g, n_gain, early_stop, tau)
+        return evaluate_case(case, cache=cache)
+    return run_seed(mode, seed, intercept_g, n_gain, early_stop, cache, tau)
+
+def handle_line(line: str) -> dict:
+    """One request line in, one response object out; failures are reported, never raised."""
+    start = time.perf_counter()
+    job_id = None
+    try:
+        job = json.loads(line)
+        if not isinstance(job, dict):
+            raise ValueError("request must be a JSON object")
+        job_id = job.get('id')
+        if job.get('cmd') == 'ping':
+            return {'id': job_id, 'ok': True, 'pid': os.getpid()}
+        result = run_job(job, _CACHE)
+    except Exception as e:
+        return {'id': job_id, 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+    return {'id': job_id, 'ok': True, 'result': result, 'elapsed': time.perf_counter() - start}
+
+def _is_shutdown(line: str) -> bool:
+    try:
+        job = json.loads(line)
+    except ValueError:
+        return False
+    return isinstance(job, dict) and job.get('cmd') == 'shutdown'
+
+def _requests(inp: Iterable[str], stop: threading.Event) -> Iterator[str]:
+    for line in inp:
+        line = line.strip()
+        if not line:
+            continue
+        if _is_shutdown(line):
+            stop.set()
+            return
+        yield line
+
+def serve_stream(inp: Iterable[str], out: TextIO, pool=None, stop: Optional[threading.Event] = None):
+    """
+    JSON-lines loop: one job per input line, one result per output line.
+    With a pool, each line is submitted as soon as it is read and results are
+    written as they complete (match them by `id`); without one, jobs run in
+    this process in order. Returns once every submitted job has answered.
+    """
+    stop = stop or threading.Event()
+    done = threading.Condition()
+    pending = 0
+
+    def emit(response: dict):
+        nonlocal pending
+        with done:
+            out.write(json.dumps(response) + '\n')
+            out.flush()
+            pending -= 1
+            done.notify_all()
+
+    for line in _requests(inp, stop):
+        with done:
+            pending += 1
+        if pool is None:
+            emit(handle_line(line))
+        else:
+            # Submitted per line (not via imap) so one idle connection cannot stall the shared pool
+            pool.apply_async(handle_line, (line,), callback=emit)
+    with done:
+        done.wait_for(lambda: pending == 0)
+
+class _JobServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        inp = io.TextIOWrapper(self.rfile, encoding='utf-8')
+        out = io.TextIOWrapper(self.wfile, encoding='utf-8', write_through=True)
+        serve_stream(inp, out, self.server.pool, self.server.stop)
+        if self.server.stop.is_set():
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+def make_pool(workers: int, cache_dir: Optional[str] = None):
+    if workers <= 0:
+        init_worker(cache_dir)
+        return None
+    return multiprocessing.Pool(workers, initializer=init_worker, initargs=(cache_dir,))
+
+def serve(workers: int = 0, cache_dir: Optional[str] = None, host: Optional[str] = None, port: int = 0):
+    """
+    Run the daemon over stdin/stdout, or over TCP when `host` is given.
+    workers=0 runs jobs in this process; otherwise a warm pool of that size
+    is shared by all connections. A {"cmd": "shutdown"} line stops it.
+    """
+    pool = make_pool(workers, cache_dir)
+    try:
+        if host is None:
+            serve_stream(sys.stdin, sys.stdout, pool)
+            return
+        with _JobServer((host, port), _JobHandler) as server:
+            server.pool = pool
+            server.stop = threading.Event()
+            logger.warning(f"WORKER LISTENING | {host}:{server.server_address[1]} | WORKERS={workers}")
+            server.serve_forever()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+def benchmark_startup(seeds: List[int], mode: str = 'ballistic') -> dict:
+    """
+    Cold path: one `main.py --headless` process per job, plus a bare `import main`
+    to isolate interpreter start and imports. Warm path: the same jobs sent
+    over stdin to a single in-process worker, timed per round trip.
+    """
+    python, cwd = sys.executable, str(PROJECT_ROOT)
+    quiet = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.DEVNULL, 'cwd': cwd, 'check': True}
+    start = time.perf_counter()
+    subprocess.run([python, '-c', 'import main'], **quiet)
+    import_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for seed in seeds:
+        subprocess.run([python, 'main.py', '--headless', '--mode', mode, '--seed', str(seed)], **quiet)
+    cold = (time.perf_counter() - start) / len(seeds)
+    proc = subprocess.Popen([python, 'main_worker.py'], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL, cwd=cwd, text=True, bufsize=1)
+    try:
+        def request(job):
+            proc.stdin.write(json.dumps(job) + '\n')
+            proc.stdin.flush()
+            return json.loads(proc.stdout.readline())
+        start = time.perf_counter()
+        request({'cmd': 'ping'})
+        ready = time.perf_counter() - start
+        latencies, compute = [], []
+        for seed in seeds:
+            start = time.perf_counter()
+            response = request({'id': seed, 'mode': mode, 'seed': seed})
+            latencies.append(time.perf_counter() - start)
+            compute.append(response['elapsed'])
+        proc.stdin.write(json.dumps({'cmd': 'shutdown'}) + '\n')
+        proc.stdin.flush()
+        proc.wait(timeout=30)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+    warm = sum(latencies) / len(latencies)
+    return {
+        'jobs': len(seeds),
+        'import_main_s': import_time,
+        'cold_job_s': cold,
+        'worker_ready_s': ready,
+        'warm_job_s': warm,
+        'warm_compute_s': sum(compute) / len(compute),
+        'speedup': cold / warm,
+    }
@@ -0,0 +1,171 @@
+### KineticDefenseSim/src/visualization/renderer.py
+import logging
+import os
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib import animation
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+from typing import Callable, List, Optional, Sequence
+
+logger = logging.getLogger("KineticDefenseSim")
+
+def resolve_video_path(path: str) -> str:
+    """
+    Output path render_video will actually write. Without ffmpeg only Pillow
+    is available, which writes GIF alone, so other suffixes become .gif.
+    Call it before simulating so the choice is known up front.
+    """
+    root, ext = os.path.splitext(path)
+    if ext.lower() == '.gif' or animation.writers.is_available('ffmpeg'):
+        return path
+    logger.warning(f"FFMPEG NOT FOUND | writing {root}.gif instead of {path}")
+    return root + '.gif'
+
+class LodTrack:
+    """
+    Level-of-detail view of a precomputed trajectory.
+    The newest `window` points are drawn at full resolution; older points are
+    thinned to every `stride`-th sample and committed once into a persistent
+    buffer, so advancing one frame costs O(window) instead of O(history).
+    """
+
+    def __init__(self, points: np.ndarray, window: int = 150, stride: int = 10):
+        self.points = np.asarray(points, dtype=float)[:, :3]
+        self.window = max(1, window)
+        self.stride = max(1, stride)
+        self._buf = np.empty((len(self.points) // self.stride + self.window + 2, 3))
+        self._reset()
+
+    def _reset(self):
+        self._n_kept = 0
+        self._committed = 0
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def visible(self, idx: int) -> np.ndarray:
+        idx = min(max(idx, 0), len(self.points) - 1)
+        if idx < self._committed:
+            self._reset()
+        boundary = max(0, idx - self.window)
+        if boundary > self._committed:
+            # Commit newly aged samples that fall on the stride grid
+            first = -(-self._committed // self.stride) * self.stride
+            aged = self.points[first:boundary:self.stride]
+            self._buf[self._n_kept:self._n_kept + len(aged)] = aged
+            self._n_kept += len(aged)
+            self._committed = boundary
+        recent = self.points[self._committed:idx + 1]
+        end = self._n_kept + len(recent)
+        self._buf[self._n_kept:end] = recent
+        return self._buf[:end]
+
+    def head(self, idx: int) -> np.ndarray:
+        return self.points[min(max(idx, 0), len(self.points) - 1)]
+
+def project_artists(artists):
+    """
+    Only Axes3D.draw projects 3D artists; blitting draws them directly, so
+    project them here with the current camera (static whenever blitting is on).
+    """
+    for artist in artists:
+        if hasattr(artist, 'do_3d_projection') and artist.axes is not None and artist.axes.M is not None:
+            artist.do_3d_projection()
+
+class _TrackGroup:
+    def __init__(self, ax, tracks: List[LodTrack], color, linewidth, linestyle, alpha, label):
+        self.tracks = tracks
+        # Seed with degenerate segments at the launch points so 3D autoscaling has data
+        seed = [np.repeat(t.points[:1], 2, axis=0) for t in tracks] or [np.zeros((2, 3))]
+        self.lines = Line3DCollection(seed, colors=color, linewidths=linewidth,
+                                      linestyles=linestyle, alpha=alpha, label=label)
+        ax.add_collection3d(self.lines)
+        self.heads = ax.scatter([], [], [], s=12, c=color, depthshade=False)
+
+    def set_frame(self, idx: int):
+        # Tracks with fewer than two visible points are skipped
+        segments = [seg for seg in (trk.visible(idx) for trk in self.tracks) if len(seg) > 1]
+        self.lines.set_segments(segments)
+        if self.tracks:
+            heads = np.array([trk.head(idx) for trk in self.tracks])
+            self.heads._offsets3d = (heads[:, 0], heads[:, 1], heads[:, 2])
+        project_artists((self.lines, self.heads))
+        return self.lines, self.heads
+
+class TrajectoryRenderer:
+    """
+    Incremental 3D trajectory renderer for many-entity engagements.
+    Each group of trajectories is a single Line3DCollection plus one head scatter,
+    so artist count stays constant regardless of raid size.
+    Blitting is used whenever the canvas supports it and the camera is static.
+    """
+
+    def __init__(self, ax, window: int = 150, stride: int = 10, follow: bool = False):
+        self.ax = ax
+        self.window = window
+        self.stride = stride
+        self.follow = follow
+        self.groups: List[_TrackGroup] = []
+        self.n_frames = 0
+
+    def add_group(self, histories: Sequence, color: str, linewidth: float = 1.5,
+                  linestyle: str = '-', alpha: float = 1.0, label: Optional[str] = None) -> _TrackGroup:
+        tracks = [LodTrack(np.asarray(h), self.window, self.stride) for h in histories if len(h) > 0]
+        group = _TrackGroup(self.ax, tracks, color, linewidth, linestyle, alpha, label)
+        self.groups.append(group)
+        self.n_frames = max([self.n_frames] + [len(t) for t in tracks])
+        return group
+
+    def fit_limits(self, margin: float = 1.1):
+        pts = np.vstack([t.points for g in self.groups for t in g.tracks])
+        max_ex = max(np.max(np.abs(pts[:, :2])), 1.0)
+        self.ax.set_xlim([-max_ex, max_ex])
+        self.ax.set_ylim([-max_ex, max_ex])
+        self.ax.set_zlim([min(0.0, np.min(pts[:, 2])), max(np.max(pts[:, 2]) * margin, 1.0)])
+
+    def _follow_camera(self, idx: int):
+        heads = np.array([t.head(idx) for g in self.groups for t in g.tracks])
+        mid = (heads.min(axis=0) + heads.max(axis=0)) / 2
+        zoom = max(np.max(heads.max(axis=0) - heads.min(axis=0)), 3000)
+        self.ax.set_xlim([mid[0] - zoom, mid[0] + zoom])
+        self.ax.set_ylim([mid[1] - zoom, mid[1] + zoom])
+        self.ax.set_zlim([max(0, mid[2] - zoom / 2), mid[2] + zoom])
+
+    def set_frame(self, idx: int) -> list:
+        artists = []
+        for group in self.groups:
+            artists.extend(group.set_frame(idx))
+        if self.follow:
+            self._follow_camera(idx)
+        return artists
+
+    def animate(self, fig, skip: Optional[int] = None, max_frames: int = 400, hold: int = 30,
+                interval: int = 20, on_frame: Optional[Callable[[int], list]] = None) -> animation.FuncAnimation:
+        skip = skip or max(1, self.n_frames // max_frames)
+        last = max(self.n_frames - 1, 0)
+
+        def update(frame):
+            idx = min(frame * skip, last)
+            artists = self.set_frame(idx)
+            if on_frame is not None:
+                extra = list(on_frame(idx))
+                project_artists(extra)
+                artists.extend(extra)
+            return artists
+
+        # A moving camera invalidates the cached background, so it cannot blit
+        blit = fig.canvas.supports_blit and not self.follow
+        return animation.FuncAnimation(fig, update, frames=last // skip + 1 + hold,
+                                       interval=interval, blit=blit)
+
+    def render_video(self, fig, path: str, fps: int = 30, dpi: int = 100, **kwargs):
+        """Offline render for headless machines. Uses ffmpeg when present, otherwise Pillow (GIF)."""
+        path = resolve_video_path(path)
+        if path.lower().endswith('.gif'):
+            writer = animation.PillowWriter(fps=fps)
+        else:
+            writer = animation.FFMpegWriter(fps=fps)
+        ani = self.animate(fig, **kwargs)
+        ani.save(path, writer=writer, dpi=dpi)
+        plt.close(fig)
+        return path
@@ -0,0 +1,47 @@
+### KineticDefenseSim/tests/test_cache.py
+import os
+import numpy as np
+import pytest
+from src.analysis.cache import ResultCache
+from src.legacy.config import SimulationConfig
+
+def test_roundtrip_and_key_stability(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    key = cache.key(kind='run', seed=3, sim_cfg=SimulationConfig())
+    assert key == cache.key(sim_cfg=SimulationConfig(), seed=3, kind='run')
+    assert key != cache.key(kind='run', seed=4, sim_cfg=SimulationConfig())
+    assert cache.get(key) is None
+    traj = {'target': np.arange(12.0).reshape(4, 3)}
+    cache.put(key, {'hit': True, 'miss': 1.5}, traj)
+    assert cache.get(key) == {'hit': True, 'miss': 1.5}
+    assert np.array_equal(cache.get_trajectories(key)['target'], traj['target'])
+
+def test_failed_write_leaves_no_entry(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    key = cache.key(kind='run', seed=1)
+
+    def explode(f):
+        f.write(b'{"hit": tr')
+        raise RuntimeError("interrupted")
+
+    with pytest.raises(RuntimeError):
+        cache._atomic_write(cache._path(key, '.json'), explode)
+    assert cache.get(key) is None
+    assert not [name for _, _, files in os.walk(tmp_path) for name in files]
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=10**9)
+    keys = [cache.key(kind='run', seed=k) for k in range(6)]
+    for age, key in enumerate(keys):
+        cache.put(key, {'miss': float(age), 'pad': 'x' * 200})
+        path = cache._path(key, '.json')
+        os.utime(path, (1000.0 + age, 1000.0 + age))
+    # Reading the oldest entry makes it the most recently used
+    assert cache.get(keys[0]) is not None
+    entry = cache._path(keys[0], '.json').stat().st_size
+    cache.max_bytes = 4 * entry
+    cache.evict()
+    alive = [cache.get(key) is not None for key in keys]
+    assert alive[0]
+    assert alive[1:3] == [False, False]
+    assert sum(alive) <= 4
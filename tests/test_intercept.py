@@ -0,0 +1,48 @@
+### KineticDefenseSim/tests/test_intercept.py
+import warnings
+import numpy as np
+from src.gnc.intercept import InterceptSolver
+from src.models.threat import Threat
+
+def _closed_form_tgo(r0, u, speed):
+    """Smallest t > 0 with |r0 + u t| = speed * t (constant-velocity threat and interceptor)."""
+    a = np.dot(u, u) - speed**2
+    b = 2 * np.dot(r0, u)
+    c = np.dot(r0, r0)
+    roots = np.roots([a, b, c])
+    roots = roots[np.isreal(roots)].real
+    return roots[roots > 0].min()
+
+def test_tgo_matches_constant_velocity_closed_form():
+    threats = [Threat(0, np.array([6000.0, 2000.0, 3000.0]), np.array([-250.0, 40.0, 0.0])),
+               Threat(1, np.array([-4000.0, 5000.0, 1000.0]), np.array([120.0, -80.0, 30.0]))]
+    positions = np.array([[0.0, 0.0, 0.0], [500.0, -300.0, 0.0]])
+    speeds = np.array([400.0, 600.0])
+    velocities = np.c_[speeds, np.zeros(2), np.zeros(2)]
+    solver = InterceptSolver(grid_dt=0.01, tol=1e-6, gravity=0.0)
+    sol = solver.solve(0.0, [10, 11], positions, velocities, np.ones(2), lambda t: 0.0, threats)
+    for i, (pos, speed) in enumerate(zip(positions, speeds)):
+        for j, th in enumerate(threats):
+            expected = _closed_form_tgo(th.position - pos, th.velocity, speed)
+            assert sol.converged[i, j]
+            assert abs(sol.tgo[i, j] - expected) < 1e-3
+            assert np.allclose(sol.pip[i, j], th.position + th.velocity * expected, atol=0.5)
+
+def test_unreachable_pair_is_inf_without_warnings():
+    threats = [Threat(0, np.array([5000.0, 0.0, 0.0]), np.array([-100.0, 0.0, 0.0])),
+               Threat(1, np.array([1e7, 0.0, 0.0]), np.array([3000.0, 0.0, 0.0]))]
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        sol = InterceptSolver(gravity=0.0).solve(0.0, [1], np.zeros((1, 3)), np.array([[200.0, 0.0, 0.0]]),
+                                                 np.array([50.0]), lambda t: 0.0, threats)
+    assert np.isfinite(sol.tgo[0, 0])
+    assert np.isinf(sol.tgo[0, 1])
+    assert np.isnan(sol.pip[0, 1]).all()
+
+def test_gravity_only_shortens_reach_time():
+    threats = [Threat(0, np.array([9000.0, 0.0, 4000.0]), np.array([-200.0, 0.0, 0.0]))]
+    args = (0.0, [1], np.zeros((1, 3)), np.array([[0.0, 0.0, 100.0]]), np.array([50.0]), lambda t: 0.0, threats)
+    without = InterceptSolver(gravity=0.0).solve(*args).tgo[0, 0]
+    with_g = InterceptSolver().solve(*args).tgo[0, 0]
+    # The bound must stay optimistic, i.e. never later than the gravity-free estimate
+    assert with_g <= without
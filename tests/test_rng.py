@@ -0,0 +1,42 @@
+### KineticDefenseSim/tests/test_rng.py
+import pickle
+import numpy as np
+from src.core.rng import NoiseStream, RngStreams
+
+PATH = ('scenario', 12, 'target', 0, 'radar')
+
+def test_streams_depend_only_on_their_path():
+    alone = RngStreams(7).generator(*PATH).standard_normal(16)
+    streams = RngStreams(7)
+    # Creating other streams first must not shift this one
+    for k in range(5):
+        streams.generator('scenario', k, 'target', 0, 'maneuver').standard_normal(3)
+    crowded = streams.generator(*PATH).standard_normal(16)
+    assert np.array_equal(alone, crowded)
+
+def test_paths_and_master_seeds_give_distinct_streams():
+    draws = [RngStreams(7).generator(*PATH).standard_normal(8),
+             RngStreams(8).generator(*PATH).standard_normal(8),
+             RngStreams(7).generator('scenario', 13, 'target', 0, 'radar').standard_normal(8),
+             RngStreams(7).generator(*PATH, 'fork', 0).standard_normal(8)]
+    for i in range(len(draws)):
+        for j in range(i + 1, len(draws)):
+            assert not np.array_equal(draws[i], draws[j])
+
+def test_noise_stream_is_independent_of_block_size():
+    small = RngStreams(7).noise(*PATH, block=7)
+    large = RngStreams(7).noise(*PATH)
+    a = np.concatenate([small.standard_normal(6) for _ in range(50)])
+    b = np.concatenate([large.standard_normal(6) for _ in range(50)])
+    assert np.array_equal(a, b)
+
+def test_noise_stream_pickles_mid_block():
+    stream = RngStreams(7).noise(*PATH, block=32)
+    stream.standard_normal(45)
+    copy = pickle.loads(pickle.dumps(stream))
+    assert np.array_equal(stream.standard_normal(100), copy.standard_normal(100))
+
+def test_seeded_noise_stream_matches_plain_generator():
+    stream = NoiseStream(np.random.default_rng(5), block=10)
+    expected = np.random.default_rng(5).standard_normal(36)
+    assert np.array_equal(np.concatenate([stream.standard_normal(6) for _ in range(6)]), expected)